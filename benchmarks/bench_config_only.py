@@ -0,0 +1,64 @@
+"""
+Бенчмарк создания только JSON-конфигов (CREATE_DATA_TEMPLATES=False): обработка через pandas
+в сравнении с обработкой без pandas (ConfigOnlyPipeline, PANDAS_FREE_CONFIGS=True).
+
+Замеряется разовый запуск без кэша загруженных данных, а также повторный запуск через pandas с кэшем.
+Совпадение конфигов, созданных обоими способами, проверяется в tests/test_config_only.py.
+
+Запуск из корня репозитория:
+    python benchmarks/bench_config_only.py --signals 1000 10000 100000
+"""
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+os.environ.setdefault("LIST_OF_SIGNALS_NAME", "benchmark.xlsx")
+
+from main import process_signals_file
+from settings import settings
+from synthetic import generate_workbook
+
+
+def measure(output_dir: Path, **values) -> float:
+    """Создает конфиги в папке с переопределенными настройками и возвращает время обработки."""
+
+    with settings.overridden(OUTPUT_FILES_DIR=output_dir, **values):
+        start = time.perf_counter()
+        process_signals_file()
+        return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--signals", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--assets", type=int, default=20)
+    args = parser.parse_args()
+
+    # Предупреждения о пропущенных типах данных ожидаемы для синтетических данных
+    logging.getLogger().setLevel(logging.ERROR)
+    print(f"{'signals':>8} {'pandas, s':>10} {'pandas (кэш), s':>16} {'без pandas, s':>14}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        for size in args.signals:
+            workbook = tmp_dir / f"signals_{size}.xlsx"
+            generate_workbook(workbook, signals=size, devices=max(size // 50, 1), assets=args.assets)
+            with settings.overridden(
+                INPUT_FILES_DIR=tmp_dir,
+                LIST_OF_SIGNALS_NAME=workbook.name,
+                CACHE_DIR=tmp_dir / "cache",
+                CREATE_DATA_TEMPLATES=False,
+                INCREMENTAL_OUTPUT=False
+            ):
+                pandas_time = measure(tmp_dir / "pandas", CACHE_ENABLED=True)
+                cached_time = measure(tmp_dir / "pandas", CACHE_ENABLED=True)
+                pandas_free_time = measure(tmp_dir / "pandas_free", PANDAS_FREE_CONFIGS=True)
+            print(f"{size:>8} {pandas_time:>10.4f} {cached_time:>16.4f} {pandas_free_time:>14.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Бенчмарк DataMapper: сравнение create_data_mapping с построчной реализацией через iterrows
+и create_slaves_mapping с реализацией, фильтрующей DataFrame для каждого устройства.
+
+Запуск из корня репозитория:
+    python benchmarks/bench_data_mapper.py --sizes 1000 10000 100000
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+os.environ.setdefault("LIST_OF_SIGNALS_NAME", "benchmark.xlsx")
+
+import numpy as np
+import pandas as pd
+from data_mapper import DataMapper
+from settings import settings
+
+
+def create_data_mapping_iterrows(signals: pd.DataFrame) -> dict:
+    """Исходная построчная реализация create_data_mapping для сравнения."""
+
+    mapping = {}
+    for _, row in signals.iterrows():
+        code = row[settings.CODE_COLUMN]
+        if settings.DIVIDE_DATA_BY_ASSET:
+            file_suffix = row[settings.ASSET_COLUMN]
+        else:
+            file_suffix = "all_assets"
+        mapping[code] = {
+            "type": row[settings.VALUE_TYPE_COLUMN],
+            "base": [f"{settings.EXCEL_DATA_NAME}_{file_suffix}.xlsx", code]
+        }
+    return mapping
+
+
+def create_slaves_mapping_per_device(signals: pd.DataFrame) -> dict:
+    """Исходная реализация create_slaves_mapping с фильтрацией DataFrame для каждого устройства."""
+
+    mapping = {}
+    uniqe_device = signals[settings.SIGNALS_SHEET_DEVICE_COLUMN].unique()
+    for device in uniqe_device:
+        device_signals = signals.loc[signals[settings.SIGNALS_SHEET_DEVICE_COLUMN] == device]
+        mapping[device] = {
+            "slaveID": int(device_signals[settings.COMMON_ADDRESS_COLUMN].iloc[0]),
+            "holdings": device_signals.set_index(settings.ADDRESS_COLUMN)[settings.CODE_COLUMN].to_dict()
+        }
+    return mapping
+
+
+def make_signals(size: int, assets: int = 20, signals_per_device: int = 20) -> pd.DataFrame:
+    """Создает DataFrame со случайными сигналами заданного размера."""
+
+    rng = np.random.default_rng(0)
+    devices = rng.integers(0, max(size // signals_per_device, 1), size)
+    return pd.DataFrame({
+        settings.SIGNALS_SHEET_DEVICE_COLUMN: [f"device_{i}" for i in devices],
+        settings.CODE_COLUMN: [f"signal_{i}" for i in range(size)],
+        settings.ADDRESS_COLUMN: rng.integers(0, 1000, size).astype(str).astype(object),
+        settings.VALUE_TYPE_COLUMN: rng.choice(["hfloat", "hint"], size).astype(object),
+        settings.ASSET_COLUMN: rng.choice([f"asset_{i}" for i in range(assets)], size).astype(object),
+        settings.COMMON_ADDRESS_COLUMN: (devices + 1).astype(str).astype(object)
+    })
+
+
+def measure(func, *args) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    args = parser.parse_args()
+
+    cases = [
+        ("create_data_mapping", create_data_mapping_iterrows,
+         lambda signals: DataMapper.create_data_mapping("all_assets", signals)),
+        ("create_slaves_mapping", create_slaves_mapping_per_device, DataMapper.create_slaves_mapping),
+    ]
+    for name, legacy_func, current_func in cases:
+        print(name)
+        print(f"{'signals':>10} {'legacy, s':>12} {'current, s':>12} {'speedup':>8}")
+        for size in args.sizes:
+            signals = make_signals(size)
+            legacy_time, legacy = measure(legacy_func, signals)
+            current_time, current = measure(current_func, signals)
+            if json.dumps(legacy, ensure_ascii=False, indent=4) != json.dumps(current, ensure_ascii=False, indent=4):
+                raise AssertionError(f"Результаты реализаций {name} не совпадают для {size} сигналов")
+            print(f"{size:>10} {legacy_time:>12.4f} {current_time:>12.4f} {legacy_time / current_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Бенчмарк записи JSON-конфига: json.dump с отступом 4 в сравнении с потоковой записью JsonConfigWriter
+(с отступом 4, 2 и в компактном виде). Для каждого варианта выводится размер файла и время записи.
+При наличии orjson запись через orjson сравнивается с записью стандартным модулем json с тем же отступом;
+если orjson оказывается медленнее, выводится предупреждение и скрипт завершается с ошибкой.
+
+Запуск из корня репозитория:
+    python benchmarks/bench_json_writer.py --sizes 10000 100000 1000000
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+os.environ.setdefault("LIST_OF_SIGNALS_NAME", "benchmark.xlsx")
+
+import json_writer
+from json_writer import JsonConfigWriter
+
+
+def make_config(size: int, signals_per_device: int = 50) -> dict:
+    """Создает конфиг эмулятора с заданным количеством сигналов."""
+
+    signals = {
+        f"signal_{i}": {"type": "hfloat", "base": ["data_asset.xlsx", f"signal_{i}"]}
+        for i in range(size)
+    }
+    slaves = {}
+    for i in range(size):
+        device = f"device_{i // signals_per_device}"
+        slave = slaves.setdefault(device, {"slaveID": i // signals_per_device + 1, "holdings": {}})
+        slave["holdings"][str(i % signals_per_device)] = f"signal_{i}"
+    return {
+        "signals": signals,
+        "servers": {"Test": {"host": "0.0.0.0", "port": 502, "period": [0, 10, 0], "slaves": slaves}}
+    }
+
+
+def write_json_dump(config: dict, path: Path) -> None:
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(config, file, ensure_ascii=False, indent=4)
+
+
+def write_streaming(indent: int, use_orjson: bool = True):
+    def write(config: dict, path: Path) -> None:
+        writer = JsonConfigWriter(indent)
+        writer.use_orjson = writer.use_orjson and use_orjson
+        with open(path, "wb") as file:
+            writer.dump(config, file)
+    return write
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    cases = [
+        ("json.dump, indent=4", write_json_dump),
+        ("stream, indent=4", write_streaming(4)),
+        ("stream, indent=2 (json)", write_streaming(2, use_orjson=False)),
+        ("stream, compact (json)", write_streaming(0, use_orjson=False)),
+    ]
+    # Варианты с orjson и соответствующие им варианты со стандартным модулем json
+    orjson_cases = {
+        "stream, indent=2 (orjson)": "stream, indent=2 (json)",
+        "stream, compact (orjson)": "stream, compact (json)",
+    }
+    if json_writer.orjson is not None:
+        cases += [(name, write_streaming(2 if "indent=2" in name else 0)) for name in orjson_cases]
+
+    slower = []
+    print(f"{'signals':>10} {'writer':<26} {'size, MB':>9} {'time, s':>8}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size in args.sizes:
+            config = make_config(size)
+            times = {}
+            for name, write in cases:
+                path = Path(tmp_dir) / "config.json"
+                start = time.perf_counter()
+                write(config, path)
+                times[name] = time.perf_counter() - start
+                if json.loads(path.read_bytes()) != config:
+                    raise AssertionError(f"Записанный конфиг ({name}) не совпадает с исходным")
+                print(f"{size:>10} {name:<26} {path.stat().st_size / 2 ** 20:>9.2f} {times[name]:>8.3f}")
+            slower += [
+                f"{size}: {name} {times[name]:.3f} с > {json_name} {times[json_name]:.3f} с"
+                for name, json_name in orjson_cases.items()
+                if name in times and times[name] > times[json_name]
+            ]
+
+    if slower:
+        print("ВНИМАНИЕ: запись через orjson медленнее записи стандартным модулем json:")
+        for line in slower:
+            print(f"  {line}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
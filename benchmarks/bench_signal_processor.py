@@ -0,0 +1,94 @@
+"""
+Бенчмарк SignalProcessor: сравнение последовательного вызова шагов filter_signals, group_signals,
+concatenate_devices и fill_missing_data_types с объединенным шагом SignalProcessor.process.
+
+Запуск из корня репозитория:
+    python benchmarks/bench_signal_processor.py --sizes 10000 100000 1000000
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+os.environ.setdefault("LIST_OF_SIGNALS_NAME", "benchmark.xlsx")
+
+import numpy as np
+import pandas as pd
+from settings import settings
+from signal_processor import SignalProcessor
+
+
+def make_merged_signals(
+        size: int,
+        assets: int = 20,
+        signals_per_device: int = 50,
+        gateways: int = 4,
+        shared_registers: float = 0.05,
+        missing_value_types: float = 0.1
+) -> pd.DataFrame:
+    """Создает объединенный DataFrame сигналов и устройств с типами столбцов, как после DataLoader."""
+
+    rng = np.random.default_rng(0)
+    device_count = max(size // signals_per_device, 1)
+    devices = rng.integers(0, device_count, size)
+    addresses = np.arange(size) % 10_000
+    shared = rng.random(size) < shared_registers
+    addresses[shared] = addresses[shared] // 2
+    value_types = rng.choice(np.array(["hfloat", "hint", "float", "int"], dtype=object), size)
+    value_types[rng.random(size) < missing_value_types] = None
+    signal_types = np.where(rng.random(size) < 0.9, settings.ONLY_SIGNALS_TYPE, "Команда")
+    return pd.DataFrame({
+        settings.SIGNALS_SHEET_DEVICE_COLUMN: pd.Categorical([f"device_{i}" for i in devices]),
+        settings.CODE_COLUMN: [f"signal_{i}" for i in range(size)],
+        settings.SIGNAL_TYPE_COLUMN: pd.Categorical(signal_types),
+        settings.ADDRESS_COLUMN: pd.array(addresses, dtype="Int64"),
+        settings.VALUE_TYPE_COLUMN: pd.Categorical(value_types),
+        settings.ASSET_COLUMN: pd.Categorical([f"asset_{i % assets}" for i in devices]),
+        settings.GATEWAY_COLUMN: pd.Categorical([f"gateway_{i % gateways}" for i in devices]),
+        # Каждое десятое устройство использует slave_id предыдущего
+        settings.COMMON_ADDRESS_COLUMN: pd.array(devices - (devices % 10 == 9) + 1, dtype="Int64")
+    })
+
+
+def process_by_steps(signals: pd.DataFrame) -> pd.DataFrame:
+    """Последовательный вызов шагов SignalProcessor, как до появления SignalProcessor.process."""
+
+    processor = SignalProcessor()
+    signals = processor.filter_signals(signals)
+    signals = processor.group_signals(signals)
+    signals = processor.concatenate_devices(signals)
+    return processor.fill_missing_data_types(signals)
+
+
+def measure(func, *args) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=3, help="количество прогонов, берется минимальное время")
+    args = parser.parse_args()
+
+    # Предупреждения о пропущенных типах данных ожидаемы для синтетических данных
+    logging.basicConfig(level=logging.ERROR)
+    print(f"{'signals':>10} {'steps, s':>12} {'process, s':>12} {'speedup':>8}")
+    for size in args.sizes:
+        signals = make_merged_signals(size)
+        steps_time = process_time = float("inf")
+        for _ in range(args.repeat):
+            elapsed, by_steps = measure(process_by_steps, signals)
+            steps_time = min(steps_time, elapsed)
+            elapsed, fused = measure(SignalProcessor.process, signals)
+            process_time = min(process_time, elapsed)
+        pd.testing.assert_frame_equal(fused, by_steps, check_categorical=False)
+        print(f"{size:>10} {steps_time:>12.4f} {process_time:>12.4f} {steps_time / process_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
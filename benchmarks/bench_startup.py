@@ -0,0 +1,94 @@
+"""
+Замер времени запуска: импорт main.py, полный запуск с шаблонами данных и запуск с созданием только
+JSON-конфигов (CREATE_DATA_TEMPLATES=False) через pandas и без pandas (PANDAS_FREE_CONFIGS=True).
+Каждый замер выполняется в новом процессе интерпретатора, также проверяется, что при создании
+конфигов без pandas pandas не импортируется.
+
+Запуск из корня репозитория:
+    python benchmarks/bench_startup.py --signals 1000 --output startup.json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+os.environ.setdefault("LIST_OF_SIGNALS_NAME", "benchmark.xlsx")
+
+from synthetic import generate_workbook
+
+# Код, выполняемый в отдельном процессе: время от старта интерпретатора и импортированные тяжелые библиотеки
+_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+sys.path.insert(0, {src_dir!r})
+import main
+imported = time.perf_counter()
+if {run!r}:
+    main.main()
+finished = time.perf_counter()
+print(json.dumps({{
+    "import": imported - start,
+    "total": finished - start,
+    "modules": [name for name in ("pandas", "numpy", "openpyxl", "pyarrow") if name in sys.modules]
+}}))
+"""
+
+
+def measure(run: bool, env: dict) -> dict:
+    """Выполняет импорт main.py (и запуск main при run=True) в новом процессе и возвращает время."""
+
+    script = "import json\n" + _SCRIPT.format(src_dir=str(SRC_DIR), run=run)
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True, text=True, env={**os.environ, **env}, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--signals", type=int, default=1_000)
+    parser.add_argument("--repeat", type=int, default=5, help="количество запусков, берется минимальное время")
+    parser.add_argument("--output", type=Path, help="JSON-файл для сохранения результатов")
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        workbook = Path(tmp_dir) / "signals.xlsx"
+        generate_workbook(workbook, signals=args.signals, devices=max(args.signals // 50, 1), assets=20)
+        env = {
+            "INPUT_FILES_DIR": tmp_dir,
+            "LIST_OF_SIGNALS_NAME": workbook.name,
+            "OUTPUT_FILES_DIR": str(Path(tmp_dir) / "output"),
+            "CACHE_ENABLED": "False",
+            "INCREMENTAL_OUTPUT": "False",
+            "LOGGING_LEVEL": "ERROR"
+        }
+        cases = {
+            "import main": (False, {}),
+            "main (конфиги и шаблоны)": (True, {"CREATE_DATA_TEMPLATES": "True"}),
+            "main (только конфиги)": (True, {"CREATE_DATA_TEMPLATES": "False"}),
+            "main (конфиги без pandas)": (True, {"CREATE_DATA_TEMPLATES": "False", "PANDAS_FREE_CONFIGS": "True"}),
+        }
+        for name, (run, case_env) in cases.items():
+            runs = [measure(run, {**env, **case_env}) for _ in range(args.repeat)]
+            best = min(runs, key=lambda result: result["total"])
+            results[name] = best
+            print(
+                f"{name:<28} импорт {min(r['import'] for r in runs):.3f} с, всего {best['total']:.3f} с, "
+                f"библиотеки: {', '.join(best['modules']) or '-'}"
+            )
+
+    if args.output:
+        report = {"python": sys.version.split()[0], "signals": args.signals, "results": results}
+        args.output.write_text(json.dumps(report, ensure_ascii=False, indent=4), encoding="utf-8")
+        print(f"Результаты сохранены в {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""
+Замер времени всех этапов обработки на синтетических списках сигналов.
+
+Для каждого размера генерируется список сигналов (benchmarks/synthetic.py), после чего замеряется время
+загрузки (DataLoader), объединения (DataConstructor.merge), обработки сигналов (SignalProcessor), создания
+маппингов (DataMapper), генерации конфигов (ConfigGenerator) и записи файлов (FileCreator).
+Этапы по ассетам суммируются по всем ассетам. Результаты сохраняются в JSON-файл, который можно
+сравнить с результатами другой версии через --compare.
+
+Запуск из корня репозитория:
+    python benchmarks/run_benchmarks.py --signals 1000 10000 100000 --output results.json
+    python benchmarks/run_benchmarks.py --signals 1000 10000 100000 --compare results.json
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+os.environ.setdefault("LIST_OF_SIGNALS_NAME", "benchmark.xlsx")
+
+import pandas as pd
+from data_loader import DataLoader, DataConstructor
+from data_mapper import DataMapper, ConfigGenerator
+from file_creator import FileCreator
+from output_planner import Artifact, OutputPlanner
+from settings import settings
+from signal_processor import SignalProcessor
+from synthetic import generate_workbook
+
+
+class StageTimer:
+    """Накапливает время этапов в рамках одного прогона."""
+
+    def __init__(self):
+        self.seconds = defaultdict(float)
+
+    def __call__(self, stage: str, func, *args):
+        start = time.perf_counter()
+        result = func(*args)
+        self.seconds[stage] += time.perf_counter() - start
+        return result
+
+
+def run_pipeline(workbook: Path, output_dir: Path) -> tuple[dict, dict]:
+    """Выполняет все этапы обработки и возвращает время этапов и количество строк."""
+
+    settings.override(
+        INPUT_FILES_DIR=workbook.parent,
+        LIST_OF_SIGNALS_NAME=workbook.name,
+        OUTPUT_FILES_DIR=output_dir,
+        CACHE_ENABLED=False,
+        INCREMENTAL_OUTPUT=False
+    )
+    timer = StageTimer()
+    processor = SignalProcessor()
+
+    signals, devices = timer("DataLoader.load", DataLoader(workbook).load)
+    merged = timer("DataConstructor.merge", DataConstructor.merge, signals, devices)
+    normalized = timer("SignalProcessor.process", processor.process, merged)
+    partitions = timer("SignalProcessor.divide_by_assets", lambda: list(processor.divide_by_assets(normalized)))
+
+    for asset, asset_signals in partitions:
+        artifacts = OutputPlanner.plan(asset)
+        config = None
+        template = None
+        if Artifact.CONFIG in artifacts:
+            data_mapping = timer("DataMapper.create_data_mapping", DataMapper.create_data_mapping, asset, asset_signals)
+            slaves_mapping = timer("DataMapper.create_slaves_mapping", DataMapper.create_slaves_mapping, asset_signals)
+            config = timer("ConfigGenerator.generate_config", ConfigGenerator.generate_config, data_mapping, slaves_mapping)
+        if Artifact.DATA in artifacts:
+            template = timer("DataMapper.get_template_codes", DataMapper.get_template_codes, asset_signals)
+        file_creator = FileCreator(asset, template, config)
+        if Artifact.CONFIG in artifacts:
+            timer("FileCreator.create_json_with_config", file_creator.create_json_with_config)
+        if Artifact.DATA in artifacts:
+            timer("FileCreator.create_excel_data_template", file_creator.create_excel_data_template)
+
+    rows = {
+        "signals": len(signals),
+        "devices": len(devices),
+        "merged": len(merged),
+        "normalized": len(normalized),
+        "partitions": len(partitions)
+    }
+    return dict(timer.seconds), rows
+
+
+def get_metadata() -> dict:
+    """Возвращает сведения об окружении и версии кода для сопоставления результатов."""
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, cwd=Path(__file__).resolve().parent, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "engine": DataLoader.get_engine()
+    }
+
+
+def print_comparison(results: list[dict], baseline: dict) -> None:
+    """Выводит отношение времени этапов к результатам другой версии (больше 1 - замедление)."""
+
+    baseline_results = {json.dumps(result["params"], sort_keys=True): result for result in baseline["results"]}
+    print(f"\nСравнение с {baseline['metadata'].get('commit')} ({baseline['metadata'].get('timestamp')}):")
+    for result in results:
+        previous = baseline_results.get(json.dumps(result["params"], sort_keys=True))
+        if previous is None:
+            continue
+        print(f"signals={result['params']['signals']}")
+        for stage, seconds in result["stages"].items():
+            previous_seconds = previous["stages"].get(stage)
+            if previous_seconds:
+                print(f"  {stage:<42} {previous_seconds:>9.4f} -> {seconds:>9.4f}  x{seconds / previous_seconds:.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--signals", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--signals-per-device", type=int, default=50)
+    parser.add_argument("--assets", type=int, default=20)
+    parser.add_argument("--shared-registers", type=float, default=0.05)
+    parser.add_argument("--missing-value-types", type=float, default=0.1)
+    parser.add_argument("--divide-config", action=argparse.BooleanOptionalAction, default=True)
+    parser.add_argument("--divide-data", action=argparse.BooleanOptionalAction, default=True)
+    parser.add_argument("--repeat", type=int, default=3, help="количество прогонов, берется минимальное время")
+    parser.add_argument("--workbooks-dir", type=Path, help="папка для сгенерированных файлов (повторно используются)")
+    parser.add_argument("--output", type=Path, help="JSON-файл для сохранения результатов")
+    parser.add_argument("--compare", type=Path, help="JSON-файл с результатами другой версии для сравнения")
+    args = parser.parse_args()
+
+    # Предупреждения о пропущенных типах данных ожидаемы для синтетических данных
+    logging.basicConfig(level=logging.ERROR)
+    settings.override(DIVIDE_CONFIG_BY_ASSET=args.divide_config, DIVIDE_DATA_BY_ASSET=args.divide_data)
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        workbooks_dir = args.workbooks_dir or Path(tmp_dir) / "workbooks"
+        for size in args.signals:
+            params = {
+                "signals": size,
+                "devices": max(size // args.signals_per_device, 1),
+                "assets": args.assets,
+                "shared_registers": args.shared_registers,
+                "missing_value_types": args.missing_value_types,
+                "divide_config": args.divide_config,
+                "divide_data": args.divide_data
+            }
+            workbook = workbooks_dir / (
+                f"signals_{size}_devices_{params['devices']}_assets_{args.assets}"
+                f"_shared_{args.shared_registers}_missing_{args.missing_value_types}.xlsx"
+            )
+            if not workbook.exists():
+                print(f"Генерация {workbook.name}...", file=sys.stderr)
+                generate_workbook(
+                    workbook,
+                    signals=size,
+                    devices=params["devices"],
+                    assets=args.assets,
+                    shared_registers=args.shared_registers,
+                    missing_value_types=args.missing_value_types
+                )
+
+            # Для этапов - минимум по прогонам, для общего времени - минимум полного времени прогонов
+            # (сумма минимумов этапов из разных прогонов занижала бы общее время)
+            best = {}
+            best_total = float("inf")
+            for _ in range(args.repeat):
+                stages, rows = run_pipeline(workbook, Path(tmp_dir) / "output")
+                for stage, seconds in stages.items():
+                    best[stage] = min(seconds, best.get(stage, seconds))
+                best_total = min(best_total, sum(stages.values()))
+            best["total"] = best_total
+            results.append({"params": params, "rows": rows, "stages": best})
+
+            print(f"signals={size}, rows={rows}")
+            for stage, seconds in best.items():
+                print(f"  {stage:<42} {seconds:>9.4f} s")
+
+    report = {"metadata": get_metadata(), "results": results}
+    if args.output:
+        args.output.write_text(json.dumps(report, ensure_ascii=False, indent=4), encoding="utf-8")
+        print(f"Результаты сохранены в {args.output}")
+    if args.compare:
+        print_comparison(results, json.loads(args.compare.read_text(encoding="utf-8")))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""
+Генератор синтетических списков сигналов со структурой страниц signals и devices из settings.py.
+
+Запуск из корня репозитория:
+    python benchmarks/synthetic.py input_files/synthetic.xlsx --signals 100000 --devices 2000 --assets 50
+"""
+import argparse
+import os
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+os.environ.setdefault("LIST_OF_SIGNALS_NAME", "benchmark.xlsx")
+
+from openpyxl import Workbook
+from settings import settings
+
+VALUE_TYPES = ["hfloat", "hint", "float", "int"]
+
+
+def generate_workbook(
+        path: Path,
+        signals: int,
+        devices: int,
+        assets: int,
+        gateways: int = 4,
+        shared_registers: float = 0.05,
+        missing_value_types: float = 0.1,
+        other_signal_types: float = 0.1,
+        missing_addresses: float = 0.02,
+        shared_slave_ids: float = 0.02,
+        missing_gateways: float = 0.0,
+        missing_codes: float = 0.0,
+        missing_assets: float = 0.0,
+        non_canonical_addresses: float = 0.0,
+        unknown_devices: float = 0.0,
+        duplicate_devices: float = 0.0,
+        seed: int = 0
+) -> None:
+    """
+    Создает excel-файл со списком сигналов.
+
+    Параметры:
+    - path: путь к создаваемому файлу.
+    - signals: количество строк на странице сигналов.
+    - devices: количество устройств (строк на странице устройств).
+    - assets: количество ассетов, устройства распределяются по ассетам равномерно.
+    - gateways: количество гейтвеев.
+    - shared_registers: доля сигналов, использующих регистр другого сигнала того же устройства.
+    - missing_value_types: доля сигналов без типа данных.
+    - other_signal_types: доля строк с типом, отличным от ONLY_SIGNALS_TYPE (отбрасываются при обработке).
+    - missing_addresses: доля сигналов без modbus-адреса.
+    - shared_slave_ids: доля устройств, имеющих общий slave_id (common address) с предыдущим устройством.
+    - missing_gateways: доля устройств без гейтвея.
+    - missing_codes: доля сигналов без кода.
+    - missing_assets: доля сигналов без ассета.
+    - non_canonical_addresses: доля адресов, записанных строкой с ведущим нулем (например, "0100").
+    - unknown_devices: доля сигналов устройств, отсутствующих на странице устройств.
+    - duplicate_devices: доля устройств, записанных на странице устройств дважды (с другим гейтвеем).
+    - seed: начальное значение генератора случайных чисел.
+    """
+
+    rng = random.Random(seed)
+
+    def chance(probability: float) -> bool:
+        # При нулевой доле генератор не вызывается, чтобы файлы с прежними параметрами не менялись
+        return probability > 0 and rng.random() < probability
+
+    # Устройства с общим slave_id подключены к тому же гейтвею, их регистры начинаются с другого адреса
+    common_addresses = []
+    device_gateways = []
+    next_address = []
+    for device in range(devices):
+        if device and rng.random() < shared_slave_ids:
+            common_addresses.append(common_addresses[-1])
+            device_gateways.append(device_gateways[-1])
+            next_address.append(10_000)
+        else:
+            common_addresses.append(device + 1)
+            device_gateways.append(f"gateway_{device % gateways}")
+            next_address.append(0)
+
+    workbook = Workbook(write_only=True)
+
+    signals_sheet = workbook.create_sheet(settings.SIGNALS_SHEET)
+    signals_sheet.append([
+        "id",
+        settings.SIGNALS_SHEET_DEVICE_COLUMN,
+        settings.CODE_COLUMN,
+        "name",
+        settings.SIGNAL_TYPE_COLUMN,
+        settings.ADDRESS_COLUMN,
+        settings.VALUE_TYPE_COLUMN,
+        settings.ASSET_COLUMN
+    ])
+    for index in range(signals):
+        device = rng.randrange(devices)
+        if next_address[device] % 10_000 and rng.random() < shared_registers:
+            address = rng.randrange(next_address[device] - next_address[device] % 10_000, next_address[device])
+        else:
+            address = next_address[device]
+            next_address[device] += 1
+        if address is not None and chance(non_canonical_addresses):
+            address = f"0{address}"
+        signals_sheet.append([
+            index,
+            f"unknown_device_{device}" if chance(unknown_devices) else f"device_{device}",
+            None if chance(missing_codes) else f"signal_{index}",
+            f"Сигнал {index}",
+            "Команда" if rng.random() < other_signal_types else settings.ONLY_SIGNALS_TYPE,
+            None if rng.random() < missing_addresses else address,
+            None if rng.random() < missing_value_types else rng.choice(VALUE_TYPES),
+            None if chance(missing_assets) else f"asset_{device % assets}"
+        ])
+
+    devices_sheet = workbook.create_sheet(settings.DEVICES_SHEET)
+    devices_sheet.append([settings.GATEWAY_COLUMN, settings.DEVICES_SHEET_DEVICE_COLUMN, settings.COMMON_ADDRESS_COLUMN])
+    for device in range(devices):
+        gateway = None if chance(missing_gateways) else device_gateways[device]
+        devices_sheet.append([gateway, f"device_{device}", common_addresses[device]])
+        if chance(duplicate_devices):
+            devices_sheet.append([f"gateway_{gateways}", f"device_{device}", common_addresses[device]])
+
+    path.parent.mkdir(exist_ok=True, parents=True)
+    workbook.save(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--signals", type=int, default=10_000)
+    parser.add_argument("--devices", type=int, default=500)
+    parser.add_argument("--assets", type=int, default=20)
+    parser.add_argument("--shared-registers", type=float, default=0.05)
+    parser.add_argument("--missing-value-types", type=float, default=0.1)
+    parser.add_argument("--missing-gateways", type=float, default=0.0)
+    parser.add_argument("--missing-codes", type=float, default=0.0)
+    parser.add_argument("--missing-assets", type=float, default=0.0)
+    parser.add_argument("--non-canonical-addresses", type=float, default=0.0)
+    parser.add_argument("--unknown-devices", type=float, default=0.0)
+    parser.add_argument("--duplicate-devices", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    generate_workbook(
+        args.path,
+        signals=args.signals,
+        devices=args.devices,
+        assets=args.assets,
+        shared_registers=args.shared_registers,
+        missing_value_types=args.missing_value_types,
+        missing_gateways=args.missing_gateways,
+        missing_codes=args.missing_codes,
+        missing_assets=args.missing_assets,
+        non_canonical_addresses=args.non_canonical_addresses,
+        unknown_devices=args.unknown_devices,
+        duplicate_devices=args.duplicate_devices,
+        seed=args.seed
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+import io
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Iterator, NamedTuple
+import pandas as pd
+from asset_processor import AssetProcessor
+from data_loader import DataLoader, DataConstructor
+from settings import Settings, settings
+from signal_processor import SignalProcessor
+
+
+class AssetResult(NamedTuple):
+    """
+    Результат обработки одного ассета.
+
+    - asset: название ассета ("all_assets" - для всех сигналов).
+    - config: конфиг эмулятора (None, если для ассета не создается); если устройства распределены
+      по нескольким серверам (SERVERS, SERVER_PORTS), - список конфигов серверов.
+    - template: шаблон данных - пустой DataFrame с кодами сигналов в качестве столбцов
+      (None, если для ассета не создается).
+    """
+
+    asset: str
+    config: dict | list[dict] | None
+    template: pd.DataFrame | None
+
+
+def generate(
+        source: str | Path | bytes | tuple[pd.DataFrame, pd.DataFrame],
+        overrides: Settings | dict | None = None
+) -> Iterator[AssetResult]:
+    """
+    Генерирует конфиги и шаблоны данных по ассетам в памяти, без записи файлов.
+
+    Ассеты обрабатываются по одному при переходе генератора к следующему ассету, поэтому в памяти
+    находятся данные только текущего ассета; вызывающий код сам решает, куда сохранить результаты.
+    Файлы в папку OUTPUT_FILES_DIR не записываются, кэш и манифест не используются.
+
+    Пример:
+        for asset, config, template in generate("signals.xlsx", {"DIVIDE_CONFIG_BY_ASSET": True}):
+            ...
+
+    Параметры:
+    - source: путь к excel-файлу со списком сигналов, содержимое этого файла (bytes)
+      или пара DataFrame (сигналы, устройства) со столбцами, названия которых заданы в настройках.
+    - overrides: настройки, переопределяющие значения из .env файла (объект Settings или словарь).
+      Настройки переопределяются только на время загрузки данных и обработки каждого ассета и
+      восстанавливаются перед возвратом результата, поэтому несколько генераторов с разными настройками
+      можно выполнять поочередно в одном потоке. Настройки глобальные, поэтому выполнять генераторы
+      одновременно в разных потоках нельзя.
+
+    Возвращает:
+    - Iterator: генератор результатов AssetResult (asset, config, template).
+
+    Исключения:
+    - ValueError: если в данных нет нужных столбцов или настройки заданы неверно.
+    """
+
+    if isinstance(overrides, Settings):
+        overrides = overrides.model_dump()
+
+    def overridden():
+        # Переопределение не должно действовать во время yield, иначе оно затронет вызывающий код
+        return settings.overridden(**overrides) if overrides else nullcontext()
+
+    with overridden():
+        signals, devices = _load(source)
+        merged_data = DataConstructor.merge(signals, devices)
+        processor = SignalProcessor()
+        signals_by_assets = processor.divide_by_assets(processor.process(merged_data))
+    while True:
+        with overridden():
+            partition = next(signals_by_assets, None)
+            if partition is None:
+                return
+            asset, asset_signals = partition
+            config, shard_configs, template_codes = AssetProcessor.build(asset, asset_signals)
+        # DataFrame шаблона создается только для результата API, при записи файлов достаточно кодов сигналов
+        template = None if template_codes is None else pd.DataFrame(columns=template_codes)
+        yield AssetResult(asset, config if shard_configs is None else shard_configs, template)
+
+
+def _load(source: str | Path | bytes | tuple[pd.DataFrame, pd.DataFrame]) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Загружает данные сигналов и устройств из файла, его содержимого или готовых DataFrame."""
+
+    if isinstance(source, (str, Path)):
+        return DataLoader(source).load()
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return DataLoader(io.BytesIO(source)).load()
+    if isinstance(source, tuple) and len(source) == 2:
+        return DataLoader.prepare(*source)
+    raise TypeError(f"Неподдерживаемый источник данных: {type(source).__name__}")
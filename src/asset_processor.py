@@ -0,0 +1,226 @@
+import logging
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable, Iterator
+import pandas as pd
+from data_mapper import DataMapper, ConfigGenerator
+from file_creator import FileCreator
+from instrumentation import metrics
+from output_manifest import OutputManifest
+from output_planner import Artifact, OutputPlanner
+from settings import settings
+from worker_logging import call_buffered, init_worker, replay_records
+
+
+def _process_in_worker(
+        asset: str,
+        signals: pd.DataFrame,
+        artifacts: set[Artifact]
+) -> tuple[list[logging.LogRecord], dict[Artifact, list[Path]] | None, list[dict]]:
+    """Обрабатывает ассет в рабочем процессе и возвращает накопленные логи, созданные файлы и метрики."""
+
+    metrics.pop_records()
+    records, files = call_buffered(AssetProcessor.process_safely, asset, signals, artifacts)
+    return records, files, metrics.pop_records()
+
+
+class AssetProcessor:
+    """Класс для создания маппингов, конфигов и файлов по ассетам."""
+
+    @staticmethod
+    def build(
+            asset: str,
+            signals: pd.DataFrame,
+            artifacts: set[Artifact] | None = None
+    ) -> tuple[dict | None, list[dict] | None, list | None]:
+        """
+        Создает маппинги, конфиг и коды сигналов шаблона данных для одного ассета без записи файлов.
+        Вычисляются только данные, необходимые для файлов, которые будут созданы (см. OutputPlanner).
+
+        Параметры:
+        - asset: название ассета ("all_assets" - для всех сигналов).
+        - signals: DataFrame сигналов ассета.
+        - artifacts: типы создаваемых файлов (по умолчанию - все файлы ассета по OutputPlanner.plan).
+
+        Возвращает:
+        - tuple: конфиг (None, если не создается или устройства распределены по серверам),
+          конфиги серверов (None, если устройства не распределены по серверам) и коды сигналов
+          шаблона данных (None, если шаблон не создается).
+        """
+
+        if artifacts is None:
+            artifacts = OutputPlanner.plan(asset)
+        data_mapper = DataMapper()
+        config = None
+        shard_configs = None
+        template_codes = None
+
+        if Artifact.CONFIG in artifacts:
+            # Создание маппингов:
+            with metrics.stage("DataMapper.create_data_mapping", asset, len(signals)) as stage:
+                data_mapping = data_mapper.create_data_mapping(asset, signals)
+                stage["rows_out"] = len(data_mapping)
+            with metrics.stage("DataMapper.create_slaves_mapping", asset, len(signals)) as stage:
+                slaves_mapping = data_mapper.create_slaves_mapping(signals)
+                stage["rows_out"] = len(slaves_mapping)
+            logging.debug(f"Маппинги для {asset} созданы")
+
+            # Генерация конифга:
+            with metrics.stage("ConfigGenerator.generate_config", asset):
+                config_generator = ConfigGenerator()
+                if config_generator.is_sharded():
+                    shard_configs = config_generator.generate_shard_configs(data_mapping, slaves_mapping)
+                else:
+                    config = config_generator.generate_config(data_mapping, slaves_mapping)
+            logging.debug(f"Конфиг для ассета {asset} сгенерирован")
+
+        if Artifact.DATA in artifacts:
+            with metrics.stage("DataMapper.get_template_codes", asset, len(signals)) as stage:
+                template_codes = data_mapper.get_template_codes(signals)
+                stage["rows_out"] = len(template_codes)
+            logging.debug(f"Шаблон данных для {asset} создан")
+        return config, shard_configs, template_codes
+
+    @staticmethod
+    def process(
+            asset: str,
+            signals: pd.DataFrame,
+            artifacts: set[Artifact] | None = None
+    ) -> dict[Artifact, list[Path]]:
+        """
+        Создает маппинги, конфиг и файлы для одного ассета.
+
+        Параметры:
+        - asset: название ассета ("all_assets" - для всех сигналов).
+        - signals: DataFrame сигналов ассета.
+        - artifacts: типы создаваемых файлов (по умолчанию - все файлы ассета по OutputPlanner.plan).
+
+        Возвращает:
+        - dict: пути созданных файлов каждого типа.
+        """
+
+        if artifacts is None:
+            artifacts = OutputPlanner.plan(asset)
+        config, shard_configs, template_codes = AssetProcessor.build(asset, signals, artifacts)
+
+        # Создание файлов:
+        file_creator = FileCreator(asset, template_codes, config, shard_configs)
+        files = {}
+        if Artifact.CONFIG in artifacts:
+            with metrics.stage("FileCreator.create_json_with_config", asset):
+                file_creator.create_json_with_config()
+            files[Artifact.CONFIG] = file_creator.json_file_names
+        if Artifact.DATA in artifacts:
+            with metrics.stage("FileCreator.create_excel_data_template", asset):
+                file_creator.create_excel_data_template()
+            files[Artifact.DATA] = [file_creator.excel_file_name]
+        return files
+
+    @staticmethod
+    def process_safely(
+            asset: str,
+            signals: pd.DataFrame,
+            artifacts: set[Artifact] | None = None
+    ) -> dict[Artifact, list[Path]] | None:
+        """
+        Обрабатывает ассет, записывая ошибку в лог вместо ее распространения.
+        Возвращает пути созданных файлов каждого типа или None в случае ошибки.
+        """
+
+        try:
+            return AssetProcessor.process(asset, signals, artifacts)
+        except Exception:
+            logging.exception(f"Ошибка при создании файлов для ассета {asset}")
+            return None
+
+    @staticmethod
+    def get_workers() -> int:
+        """Возвращает количество рабочих процессов (WORKERS=0 - по количеству ядер процессора)."""
+
+        return settings.WORKERS if settings.WORKERS > 0 else os.cpu_count() or 1
+
+    @staticmethod
+    def process_all(signals_by_assets: Iterable[tuple[str, pd.DataFrame]]) -> None:
+        """
+        Обрабатывает все ассеты последовательно или в пуле процессов (если WORKERS в .env файле больше 1).
+
+        В режиме пула ассеты обрабатываются параллельно, но логи каждого ассета выводятся целиком
+        в исходном порядке ассетов, поэтому результат и логи не зависят от количества процессов.
+        Ошибка в одном ассете не прерывает обработку остальных.
+        Если включено инкрементальное обновление (INCREMENTAL_OUTPUT), создаются только файлы,
+        сигналы или настройки которых изменились с предыдущего запуска (см. OutputManifest).
+
+        Параметры:
+        - signals_by_assets: пары (название ассета, DataFrame сигналов ассета).
+
+        Исключения:
+        - RuntimeError: если не удалось создать файлы хотя бы для одного ассета.
+        """
+
+        failed_assets = []
+        workers = AssetProcessor.get_workers()
+        manifest = OutputManifest() if settings.INCREMENTAL_OUTPUT else None
+
+        def get_changed_assets() -> Iterator[tuple[str, pd.DataFrame, dict[Artifact, str], set[Artifact]]]:
+            """Отбирает ассеты, файлы которых необходимо создать заново, и типы этих файлов."""
+
+            for asset, signals in signals_by_assets:
+                hashes = {}
+                artifacts = OutputPlanner.plan(asset)
+                if manifest is not None:
+                    with metrics.stage("OutputManifest.compute_hashes", asset, len(signals)):
+                        hashes = manifest.compute_hashes(asset, signals)
+                    artifacts = manifest.get_outdated(asset, hashes)
+                    if not artifacts:
+                        logging.info(f"Сигналы ассета {asset} не изменились, файлы не пересоздаются")
+                        continue
+                yield asset, signals, hashes, artifacts
+
+        def register(
+                asset: str,
+                hashes: dict[Artifact, str],
+                artifacts: set[Artifact],
+                files: dict[Artifact, list[Path]] | None
+        ) -> None:
+            if files is None:
+                failed_assets.append(asset)
+                if manifest is not None:
+                    manifest.mark_failed(asset, artifacts)
+            elif manifest is not None:
+                for artifact, artifact_files in files.items():
+                    manifest.update(asset, artifact, hashes[artifact], artifact_files)
+
+        if workers <= 1:
+            for asset, signals, hashes, artifacts in get_changed_assets():
+                register(asset, hashes, artifacts, AssetProcessor.process_safely(asset, signals, artifacts))
+        else:
+            def collect(asset: str, hashes: dict[Artifact, str], artifacts: set[Artifact], future: Future) -> None:
+                records, files, metric_records = future.result()
+                replay_records(records)
+                metrics.extend(metric_records)
+                register(asset, hashes, artifacts, files)
+
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=init_worker,
+                initargs=(settings.model_dump(),)
+            ) as executor:
+                # Количество одновременно переданных в пул ассетов ограничено,
+                # чтобы не материализовывать DataFrame всех ассетов сразу
+                pending = deque()
+                for asset, signals, hashes, artifacts in get_changed_assets():
+                    pending.append(
+                        (asset, hashes, artifacts, executor.submit(_process_in_worker, asset, signals, artifacts))
+                    )
+                    if len(pending) >= 2 * workers:
+                        collect(*pending.popleft())
+                while pending:
+                    collect(*pending.popleft())
+
+        if manifest is not None:
+            manifest.save()
+
+        if failed_assets:
+            raise RuntimeError(f"Не удалось создать файлы для ассетов: {', '.join(map(str, failed_assets))}")
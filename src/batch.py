@@ -0,0 +1,105 @@
+import logging
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from main import main
+from settings import settings
+from worker_logging import call_buffered, init_worker, replay_records
+
+# Расширения файлов со списками сигналов
+WORKBOOK_SUFFIXES = (".xlsx", ".xlsm")
+
+
+def find_workbooks(input_dir: Path) -> list[Path]:
+    """Возвращает отсортированный список файлов со списками сигналов в папке (без временных файлов excel)."""
+
+    return sorted(
+        path for path in Path(input_dir).iterdir()
+        if path.is_file() and path.suffix.lower() in WORKBOOK_SUFFIXES and not path.name.startswith(("~$", "."))
+    )
+
+
+def process_workbook(workbook: Path, output_dir: Path) -> tuple[float, str | None]:
+    """
+    Создает файлы для одного списка сигналов в отдельной подпапке папки с результатами.
+
+    Параметры:
+    - workbook: путь к файлу со списком сигналов.
+    - output_dir: общая папка с результатами.
+
+    Возвращает:
+    - tuple: время обработки в секундах и текст ошибки (None, если ошибок нет).
+    """
+
+    workbook_output_dir = output_dir / workbook.stem
+    settings.override(
+        INPUT_FILES_DIR=workbook.parent,
+        LIST_OF_SIGNALS_NAME=workbook.name,
+        OUTPUT_FILES_DIR=workbook_output_dir,
+        # Ассеты внутри файла обрабатываются последовательно, параллельно обрабатываются сами файлы
+        WORKERS=1,
+        # Метрики и профиль каждого файла сохраняются в его подпапку, чтобы процессы не перезаписывали их
+        METRICS_FILE=settings.METRICS_FILE and workbook_output_dir / Path(settings.METRICS_FILE).name,
+        PROFILE_FILE=settings.PROFILE_FILE and workbook_output_dir / Path(settings.PROFILE_FILE).name
+    )
+    start = time.perf_counter()
+    error = None
+    try:
+        main()
+    except Exception as exception:
+        logging.exception(f"Ошибка при обработке файла {workbook.name}")
+        error = str(exception) or type(exception).__name__
+    return time.perf_counter() - start, error
+
+
+def run_batch() -> list[tuple[str, float, str | None]]:
+    """
+    Обрабатывает все списки сигналов из папки INPUT_FILES_DIR в пуле процессов (количество процессов
+    задается BATCH_WORKERS, 0 - по числу ядер процессора). Результаты каждого файла сохраняются
+    в подпапку OUTPUT_FILES_DIR с именем файла. Логи каждого файла выводятся целиком в порядке файлов.
+
+    Возвращает:
+    - list: для каждого файла - имя, время обработки в секундах и текст ошибки (None, если ошибок нет).
+    """
+
+    workbooks = find_workbooks(settings.INPUT_FILES_DIR)
+    if not workbooks:
+        logging.warning(f"В папке {settings.INPUT_FILES_DIR} не найдены файлы со списками сигналов")
+        return []
+    logging.info(f"Найдено файлов со списками сигналов: {len(workbooks)}")
+
+    # Кэш общий для всех процессов: его размер должен вмещать все файлы, иначе при циклическом
+    # обращении к файлам записи вытесняются до повторного использования
+    settings_values = settings.model_dump()
+    settings_values["CACHE_MAX_ENTRIES"] = max(settings.CACHE_MAX_ENTRIES, len(workbooks))
+
+    start = time.perf_counter()
+    summary = []
+    with ProcessPoolExecutor(
+        max_workers=settings.BATCH_WORKERS or None,
+        initializer=init_worker,
+        initargs=(settings_values,)
+    ) as executor:
+        futures = [
+            executor.submit(call_buffered, process_workbook, workbook, settings.OUTPUT_FILES_DIR)
+            for workbook in workbooks
+        ]
+        for workbook, future in zip(workbooks, futures):
+            records, (elapsed, error) = future.result()
+            replay_records(records)
+            summary.append((workbook.name, elapsed, error))
+
+    logging.info(f"Итоги пакетной обработки ({time.perf_counter() - start:.2f} с):")
+    for name, elapsed, error in summary:
+        if error is None:
+            logging.info(f"  {name}: {elapsed:.2f} с, успешно")
+        else:
+            logging.error(f"  {name}: {elapsed:.2f} с, ошибка: {error}")
+    return summary
+
+
+if __name__ == "__main__":
+    batch_summary = run_batch()
+    if any(error is not None for _, _, error in batch_summary):
+        sys.exit(1)
@@ -0,0 +1,258 @@
+import logging
+import math
+from collections import Counter
+from pathlib import Path
+from typing import Iterator, NamedTuple
+from data_mapper import ConfigGenerator
+from file_creator import FileCreator
+from instrumentation import metrics
+from output_manifest import OutputManifest
+from output_planner import Artifact, OutputPlanner
+from settings import settings
+from workbook_reader import WorkbookReader
+
+
+class SignalRow(NamedTuple):
+    """Строка объединенных данных сигнала и устройства (None - отсутствующее значение)."""
+
+    device: str | None
+    code: str | None
+    signal_type: str | None
+    address: str | None
+    value_type: str | None
+    asset: str | None
+    gateway: str | None
+    common_address: str | None
+
+
+# Поля SignalRow по названиям настроек со столбцами, из которых они загружаются
+ROW_FIELDS = {
+    "SIGNALS_SHEET_DEVICE_COLUMN": "device",
+    "CODE_COLUMN": "code",
+    "SIGNAL_TYPE_COLUMN": "signal_type",
+    "ADDRESS_COLUMN": "address",
+    "VALUE_TYPE_COLUMN": "value_type",
+    "ASSET_COLUMN": "asset",
+    "GATEWAY_COLUMN": "gateway",
+    "COMMON_ADDRESS_COLUMN": "common_address",
+}
+
+
+def _json_value(value: str | None) -> str | float:
+    """Отсутствующие значения записываются в конфиг как NaN, так же как при обработке через pandas."""
+
+    return math.nan if value is None else value
+
+
+class ConfigOnlyPipeline:
+    """
+    Класс для создания только JSON-конфигов без pandas и numpy (CREATE_DATA_TEMPLATES=False
+    и PANDAS_FREE_CONFIGS=True в .env файле).
+
+    Повторяет шаги DataLoader, DataConstructor, SignalProcessor и DataMapper на списках строк, поэтому
+    конфиги совпадают с конфигами, созданными через pandas (проверяется в tests/test_config_only.py),
+    а запуск не тратит время на импорт pandas. Подходит для разовых запусков с небольшими списками сигналов:
+    ассеты обрабатываются последовательно, кэш загруженных данных не используется.
+    """
+
+    @staticmethod
+    def load(signals_file: Path) -> list[SignalRow]:
+        """Загружает страницы сигналов и устройств и объединяет их по столбцу device (как DataConstructor.merge)."""
+
+        sheets = WorkbookReader(signals_file).read({
+            settings.SIGNALS_SHEET: [
+                settings.SIGNALS_SHEET_DEVICE_COLUMN,
+                settings.CODE_COLUMN,
+                settings.SIGNAL_TYPE_COLUMN,
+                settings.ADDRESS_COLUMN,
+                settings.VALUE_TYPE_COLUMN,
+                settings.ASSET_COLUMN
+            ],
+            settings.DEVICES_SHEET: [
+                settings.GATEWAY_COLUMN,
+                settings.DEVICES_SHEET_DEVICE_COLUMN,
+                settings.COMMON_ADDRESS_COLUMN
+            ]
+        })
+        signals = sheets[settings.SIGNALS_SHEET]
+        devices = sheets[settings.DEVICES_SHEET]
+        logging.info(f"Данные загружены: signals ({len(signals)} строк), devices ({len(devices)} строк).")
+
+        # Левое объединение: для каждого сигнала - все устройства с тем же названием в порядке страницы устройств
+        devices_by_names = {}
+        for gateway, device, common_address in devices:
+            devices_by_names.setdefault(device, []).append((gateway, common_address))
+        return [
+            SignalRow(*signal, gateway, common_address)
+            for signal in signals
+            for gateway, common_address in devices_by_names.get(signal[0], [(None, None)])
+        ]
+
+    @staticmethod
+    def process(rows: list[SignalRow]) -> list[SignalRow]:
+        """Выполняет шаги SignalProcessor.process (фильтрация, группировка, объединение устройств, типы данных)."""
+
+        rows = [row for row in rows if row.signal_type == settings.ONLY_SIGNALS_TYPE and row.address is not None]
+
+        # Количество сигналов в каждом регистре, строки без slave_id не входят в группы. При наличии таких строк
+        # количество записывается как вещественное число, как в SignalProcessor.group_signals
+        group_counts = Counter((row.address, row.common_address) for row in rows if row.common_address is not None)
+        count_format = "{:.1f}" if any(row.common_address is None for row in rows) else "{}"
+
+        unique_rows = []
+        codes = set()
+        for row in rows:
+            count = group_counts[row.address, row.common_address] if row.common_address is not None else 0
+            if row.gateway is None:
+                code = None
+            elif count > 1:
+                code = f"{count_format.format(count)}_signals_{row.gateway}_{row.address}"
+            elif row.code is None:
+                code = None
+            else:
+                code = f"{row.code}_{row.gateway}"
+            if code in codes:
+                continue
+            codes.add(code)
+            unique_rows.append(row._replace(code=code))
+
+        # Объединение названий устройств с одинаковым slave_id:
+        devices_by_common_addresses = {}
+        for row in unique_rows:
+            if row.common_address is not None:
+                devices_by_common_addresses.setdefault(row.common_address, {})[row.device] = None
+        device_names = {
+            common_address: ", ".join(devices)
+            for common_address, devices in devices_by_common_addresses.items()
+        }
+
+        missing_count = sum(row.value_type is None for row in unique_rows)
+        if missing_count > 0:
+            logging.warning(f"В столбце {settings.VALUE_TYPE_COLUMN} отсутствуют значения в {missing_count} строчках")
+            logging.info(f"{missing_count} сигналам установлен тип hfloat")
+        else:
+            logging.info(f"Отсутствующие значения в столбце {settings.VALUE_TYPE_COLUMN} не обнаружены.")
+        return [
+            row._replace(
+                device=device_names.get(row.common_address),
+                value_type="hfloat" if row.value_type is None else row.value_type
+            )
+            for row in unique_rows
+        ]
+
+    @staticmethod
+    def divide_by_assets(rows: list[SignalRow]) -> Iterator[tuple[str | float, list[SignalRow]]]:
+        """
+        Разбивает сигналы по ассетам в порядке их появления (как SignalProcessor.divide_by_assets).
+        Сигналы без ассета относятся к ассету NaN (файлы с суффиксом "nan").
+        """
+
+        if OutputPlanner.needs_all_assets():
+            yield "all_assets", rows
+        if OutputPlanner.needs_asset_partitions():
+            rows_by_assets = {}
+            for row in rows:
+                rows_by_assets.setdefault(row.asset, []).append(row)
+            for asset, asset_rows in rows_by_assets.items():
+                yield _json_value(asset), asset_rows
+
+    @staticmethod
+    def create_data_mapping(rows: list[SignalRow]) -> dict:
+        """Создает словарь сигналов конфига (как DataMapper.create_data_mapping)."""
+
+        mapping = {}
+        for row in rows:
+            file_suffix = _json_value(row.asset) if settings.DIVIDE_DATA_BY_ASSET else "all_assets"
+            code = _json_value(row.code)
+            mapping[code] = {
+                "type": row.value_type,
+                "base": [f"{settings.EXCEL_DATA_NAME}_{file_suffix}.{settings.DATA_TEMPLATE_FORMAT}", code]
+            }
+        return mapping
+
+    @staticmethod
+    def create_slaves_mapping(rows: list[SignalRow]) -> dict:
+        """Создает словарь устройств конфига (как DataMapper.create_slaves_mapping)."""
+
+        rows_by_devices = {}
+        for row in rows:
+            rows_by_devices.setdefault(row.device, []).append(row)
+        return {
+            _json_value(device): {
+                "slaveID": int(_json_value(device_rows[0].common_address)),
+                "holdings": {
+                    row.address: _json_value(row.code)
+                    for row in device_rows
+                }
+            }
+            for device, device_rows in rows_by_devices.items()
+        }
+
+    @staticmethod
+    def process_asset(asset: str | float, rows: list[SignalRow]) -> list[Path]:
+        """Создает конфиг ассета и возвращает пути созданных файлов."""
+
+        if Artifact.CONFIG not in OutputPlanner.plan(asset):
+            return []
+        with metrics.stage("ConfigOnlyPipeline.create_data_mapping", asset, len(rows)) as stage:
+            data_mapping = ConfigOnlyPipeline.create_data_mapping(rows)
+            stage["rows_out"] = len(data_mapping)
+        with metrics.stage("ConfigOnlyPipeline.create_slaves_mapping", asset, len(rows)) as stage:
+            slaves_mapping = ConfigOnlyPipeline.create_slaves_mapping(rows)
+            stage["rows_out"] = len(slaves_mapping)
+        if ConfigGenerator.is_sharded():
+            file_creator = FileCreator(
+                asset, None, None, ConfigGenerator.generate_shard_configs(data_mapping, slaves_mapping)
+            )
+        else:
+            file_creator = FileCreator(asset, None, ConfigGenerator.generate_config(data_mapping, slaves_mapping))
+        logging.debug(f"Конфиг для ассета {asset} сгенерирован")
+
+        with metrics.stage("FileCreator.create_json_with_config", asset):
+            file_creator.create_json_with_config()
+        return file_creator.json_file_names
+
+    @staticmethod
+    def run() -> None:
+        """
+        Создает JSON-конфиги для списка сигналов. При INCREMENTAL_OUTPUT=True конфиги создаются только
+        для ассетов, сигналы или настройки конфигов которых изменились с предыдущего запуска.
+
+        Исключения:
+        - RuntimeError: если не удалось создать конфиг хотя бы для одного ассета.
+        """
+
+        with metrics.stage("ConfigOnlyPipeline.load") as stage:
+            rows = ConfigOnlyPipeline.load(settings.LIST_OF_SIGNALS_FILE)
+            stage["rows_out"] = len(rows)
+        with metrics.stage("ConfigOnlyPipeline.process", rows_in=len(rows)) as stage:
+            rows = ConfigOnlyPipeline.process(rows)
+            stage["rows_out"] = len(rows)
+
+        failed_assets = []
+        manifest = OutputManifest() if settings.INCREMENTAL_OUTPUT else None
+        for asset, asset_rows in ConfigOnlyPipeline.divide_by_assets(rows):
+            hashes = {}
+            if manifest is not None:
+                hashes = manifest.compute_rows_hashes(asset, {
+                    name: [getattr(row, ROW_FIELDS[name]) for row in asset_rows]
+                    for name in manifest.get_hash_columns(asset)
+                })
+                if not manifest.get_outdated(asset, hashes):
+                    logging.info(f"Сигналы ассета {asset} не изменились, файлы не пересоздаются")
+                    continue
+            try:
+                files = ConfigOnlyPipeline.process_asset(asset, asset_rows)
+            except Exception:
+                logging.exception(f"Ошибка при создании файлов для ассета {asset}")
+                failed_assets.append(asset)
+                if manifest is not None:
+                    manifest.mark_failed(asset, {Artifact.CONFIG})
+                continue
+            if manifest is not None and files:
+                manifest.update(asset, Artifact.CONFIG, hashes[Artifact.CONFIG], files)
+
+        if manifest is not None:
+            manifest.save()
+        if failed_assets:
+            raise RuntimeError(f"Не удалось создать файлы для ассетов: {', '.join(map(str, failed_assets))}")
@@ -0,0 +1,126 @@
+import hashlib
+import importlib.util
+import json
+import logging
+import os
+from pathlib import Path
+import pandas as pd
+from data_loader import DataLoader
+from settings import settings
+
+# Версия формата кэша: увеличивается при изменении логики загрузки и объединения данных
+CACHE_VERSION = 2
+
+
+class DataCache:
+    """
+    Класс для кэширования загруженных и объединенных данных сигналов и устройств на диске.
+
+    Ключ кэша - хэш содержимого файла со списком сигналов и настроек, влияющих на его разбор
+    (названия страниц, столбцов и движок чтения), поэтому изменение файла или этих настроек
+    автоматически делает запись кэша недействительной. Данные хранятся в формате parquet
+    (при наличии pyarrow), иначе - в формате pickle.
+    """
+
+    def __init__(self, signals_file: Path, cache_dir: Path | None = None):
+        self.signals_file = Path(signals_file)
+        self.cache_dir = Path(cache_dir or settings.CACHE_DIR)
+        self.suffix = ".parquet" if importlib.util.find_spec("pyarrow") is not None else ".pkl"
+        self._key = None
+
+    @staticmethod
+    def get_parse_settings() -> dict:
+        """Возвращает настройки, влияющие на результат загрузки и объединения данных."""
+
+        return {
+            "version": CACHE_VERSION,
+            "engine": DataLoader.get_engine(),
+            "sheets": [settings.SIGNALS_SHEET, settings.DEVICES_SHEET],
+            "columns": DataLoader.get_signals_columns() + DataLoader.get_devices_columns()
+        }
+
+    def get_key(self) -> str:
+        """Вычисляет ключ кэша по содержимому файла и настройкам разбора."""
+
+        if self._key is not None:
+            return self._key
+        file_hash = hashlib.sha256()
+        with open(self.signals_file, "rb") as file:
+            for chunk in iter(lambda: file.read(1 << 20), b""):
+                file_hash.update(chunk)
+        file_hash.update(json.dumps(self.get_parse_settings(), sort_keys=True).encode("utf-8"))
+        self._key = file_hash.hexdigest()
+        return self._key
+
+    def get_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{self.suffix}"
+
+    def load(self) -> pd.DataFrame | None:
+        """
+        Загружает данные из кэша.
+
+        Возвращает:
+        - DataFrame с объединенными данными или None, если запись в кэше отсутствует или повреждена.
+        """
+
+        path = self.get_path(self.get_key())
+        if not path.exists():
+            return None
+        try:
+            if self.suffix == ".parquet":
+                # Parquet восстанавливает пропуски в строковых столбцах как None, приводим их к NaN
+                data = pd.read_parquet(path)
+                data = data.mask(data.isna())
+            else:
+                data = pd.read_pickle(path)
+        except FileNotFoundError:
+            # Запись удалена другим процессом, использующим тот же кэш
+            return None
+        except Exception as error:
+            logging.warning(f"Не удалось прочитать кэш {path}: {error}")
+            path.unlink(missing_ok=True)
+            return None
+        # Обновление времени доступа для вытеснения давно не используемых записей
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return data
+
+    def save(self, data: pd.DataFrame) -> None:
+        """Сохраняет данные в кэш и удаляет устаревшие записи."""
+
+        self.cache_dir.mkdir(exist_ok=True, parents=True)
+        path = self.get_path(self.get_key())
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        if self.suffix == ".parquet":
+            data.to_parquet(tmp_path)
+        else:
+            data.to_pickle(tmp_path)
+        os.replace(tmp_path, path)
+        logging.debug(f"Данные сохранены в кэш {path}")
+        self.evict()
+
+    def evict(self) -> None:
+        """Удаляет записи кэша, давно не использовавшиеся, сверх CACHE_MAX_ENTRIES."""
+
+        entries = []
+        for path in self.cache_dir.glob("*"):
+            if path.suffix not in (".parquet", ".pkl"):
+                continue
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                # Запись удалена другим процессом, использующим тот же кэш
+                continue
+        entries.sort(key=lambda entry: entry[0], reverse=True)
+        for _, path in entries[settings.CACHE_MAX_ENTRIES:]:
+            path.unlink(missing_ok=True)
+            logging.debug(f"Запись кэша {path} удалена")
+
+    def clear(self) -> None:
+        """Полностью очищает кэш."""
+
+        for path in self.cache_dir.glob("*"):
+            if path.suffix in (".parquet", ".pkl"):
+                path.unlink(missing_ok=True)
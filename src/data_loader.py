@@ -1,5 +1,6 @@
 import pandas as pd
 from settings import settings
+from workbook_reader import WorkbookReader
 
 
 class DataLoader:
@@ -8,37 +9,164 @@ class DataLoader:
     def __init__(self, signals_file: str):
         self.signals_file = signals_file
 
+    @staticmethod
+    def get_engine() -> str:
+        """Возвращает движок для чтения Excel-файла (см. WorkbookReader.get_engine)."""
+
+        return WorkbookReader.get_engine()
+
+    def load(self) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Загружает данные сигналов и устройств за одно открытие Excel-файла.
+
+        Возвращает:
+        - tuple: (DataFrame сигналов, DataFrame устройств).
+        """
+
+        with pd.ExcelFile(self.signals_file, engine=self.get_engine()) as excel_file:
+            signals = self._parse_signals(excel_file)
+            devices = self._parse_devices(excel_file)
+        return signals, devices
+
     def load_signals(self) -> pd.DataFrame:
         """Загружает данные сигналов из Excel-файла."""
 
-        signals = pd.read_excel(
-            self.signals_file,
+        with pd.ExcelFile(self.signals_file, engine=self.get_engine()) as excel_file:
+            return self._parse_signals(excel_file)
+
+    def load_devices(self) -> pd.DataFrame:
+        """Загружает данные устройств из Excel-файла."""
+
+        with pd.ExcelFile(self.signals_file, engine=self.get_engine()) as excel_file:
+            return self._parse_devices(excel_file)
+
+    @staticmethod
+    def _parse_signals(excel_file: pd.ExcelFile) -> pd.DataFrame:
+        """Читает из открытого Excel-файла только нужные столбцы страницы сигналов."""
+
+        signals = excel_file.parse(
             sheet_name=settings.SIGNALS_SHEET,
-            usecols=[
+            usecols=DataLoader.get_signals_columns(),
+            dtype=str
+        )
+        return DataLoader._compact_signals(signals)
+
+    @staticmethod
+    def _parse_devices(excel_file: pd.ExcelFile) -> pd.DataFrame:
+        """Читает из открытого Excel-файла только нужные столбцы страницы устройств."""
+
+        devices = excel_file.parse(
+            sheet_name=settings.DEVICES_SHEET,
+            usecols=DataLoader.get_devices_columns(),
+            dtype=str
+        )
+        return DataLoader._compact_devices(devices)
+
+    @staticmethod
+    def get_signals_columns() -> list[str]:
+        """Возвращает названия столбцов страницы сигналов, используемых при обработке."""
+
+        return [
+            settings.SIGNALS_SHEET_DEVICE_COLUMN,
+            settings.CODE_COLUMN,
+            settings.SIGNAL_TYPE_COLUMN,
+            settings.ADDRESS_COLUMN,
+            settings.VALUE_TYPE_COLUMN,
+            settings.ASSET_COLUMN
+        ]
+
+    @staticmethod
+    def get_devices_columns() -> list[str]:
+        """Возвращает названия столбцов страницы устройств, используемых при обработке."""
+
+        return [settings.GATEWAY_COLUMN, settings.DEVICES_SHEET_DEVICE_COLUMN, settings.COMMON_ADDRESS_COLUMN]
+
+    @staticmethod
+    def prepare(signals: pd.DataFrame, devices: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Приводит DataFrame сигналов и устройств, полученные не из Excel-файла, к виду после загрузки:
+        отбираются нужные столбцы, значения приводятся к строкам так же, как при чтении Excel-файла
+        (см. WorkbookReader.to_str), после чего столбцы переводятся в категориальный и целочисленный типы.
+
+        Параметры:
+        - signals: DataFrame сигналов.
+        - devices: DataFrame устройств.
+
+        Возвращает:
+        - tuple: (DataFrame сигналов, DataFrame устройств).
+
+        Исключения:
+        - ValueError: если в DataFrame нет нужных столбцов.
+        """
+
+        prepared = []
+        for df, columns in ((signals, DataLoader.get_signals_columns()), (devices, DataLoader.get_devices_columns())):
+            missing_columns = [column for column in columns if column not in df.columns]
+            if missing_columns:
+                raise ValueError(f"В DataFrame нет столбцов: {', '.join(missing_columns)}")
+            prepared.append(pd.DataFrame({
+                column: df[column].map(WorkbookReader.to_str).astype(object).tolist()
+                for column in columns
+            }))
+        return DataLoader._compact_signals(prepared[0]), DataLoader._compact_devices(prepared[1])
+
+    @staticmethod
+    def _compact_signals(signals: pd.DataFrame) -> pd.DataFrame:
+        return DataLoader._compact(
+            signals,
+            categorical_columns=[
                 settings.SIGNALS_SHEET_DEVICE_COLUMN,
-                settings.CODE_COLUMN,
                 settings.SIGNAL_TYPE_COLUMN,
-                settings.ADDRESS_COLUMN,
                 settings.VALUE_TYPE_COLUMN,
                 settings.ASSET_COLUMN
             ],
-            dtype=str
+            integer_columns=[settings.ADDRESS_COLUMN]
         )
-        return signals
 
-    def load_devices(self) -> pd.DataFrame:
-        """Загружает данные устройств из Excel-файла."""
-        devices = pd.read_excel(
-            self.signals_file,
-            sheet_name=settings.DEVICES_SHEET,
-            usecols=[
-                settings.GATEWAY_COLUMN,
-                settings.DEVICES_SHEET_DEVICE_COLUMN,
-                settings.COMMON_ADDRESS_COLUMN
-            ],
-            dtype=str
+    @staticmethod
+    def _compact_devices(devices: pd.DataFrame) -> pd.DataFrame:
+        return DataLoader._compact(
+            devices,
+            categorical_columns=[settings.GATEWAY_COLUMN, settings.DEVICES_SHEET_DEVICE_COLUMN],
+            integer_columns=[settings.COMMON_ADDRESS_COLUMN]
         )
-        return devices
+
+    @staticmethod
+    def _compact(df: pd.DataFrame, categorical_columns: list[str], integer_columns: list[str]) -> pd.DataFrame:
+        """
+        Переводит столбцы с небольшим количеством различных значений в категориальный тип,
+        а столбцы адресов - в целочисленный тип Int64.
+
+        Параметры:
+        - df: DataFrame со строковыми столбцами.
+        - categorical_columns: столбцы для перевода в категориальный тип.
+        - integer_columns: столбцы для перевода в целочисленный тип.
+
+        Возвращает:
+        - DataFrame с преобразованными столбцами.
+        """
+
+        columns = {column: df[column].astype("category") for column in categorical_columns}
+        columns.update({column: DataLoader._to_integer(df[column]) for column in integer_columns})
+        return df.assign(**columns)
+
+    @staticmethod
+    def _to_integer(values: pd.Series) -> pd.Series:
+        """
+        Переводит столбец строк в тип Int64. Если хотя бы одно значение не является записью целого числа
+        (например, "0100" или "0x10"), столбец остается категориальным, чтобы коды сигналов
+        и ключи регистров в конфиге совпадали с исходными значениями.
+        """
+
+        values = values.astype("category")
+        categories = values.cat.categories
+        numbers = pd.to_numeric(categories, errors="coerce")
+        if numbers.isna().any() or (numbers != numbers.round()).any():
+            return values
+        integers = numbers.astype("int64")
+        if not (integers.astype(str) == categories).all():
+            return values
+        return values.cat.rename_categories(integers).astype("Int64")
 
 
 class DataConstructor:
@@ -62,6 +190,18 @@ class DataConstructor:
             columns={settings.DEVICES_SHEET_DEVICE_COLUMN: settings.SIGNALS_SHEET_DEVICE_COLUMN}
         )
 
+        # Приведение столбцов device к общим категориям, чтобы объединение выполнялось по кодам категорий
+        device_column = settings.SIGNALS_SHEET_DEVICE_COLUMN
+        if (
+                isinstance(signals[device_column].dtype, pd.CategoricalDtype) and
+                isinstance(devices_renamed[device_column].dtype, pd.CategoricalDtype)
+        ):
+            categories = signals[device_column].cat.categories.union(
+                devices_renamed[device_column].cat.categories, sort=False
+            )
+            signals = signals.assign(**{device_column: signals[device_column].cat.set_categories(categories)})
+            devices_renamed[device_column] = devices_renamed[device_column].cat.set_categories(categories)
+
         # Объединение датасетов по общему столбцу device
         merged_data = pd.merge(
             signals,
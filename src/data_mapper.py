@@ -1,11 +1,19 @@
-import pandas as pd
+import heapq
+import logging
+from typing import TYPE_CHECKING
+from register_index import RegisterIndex
 from settings import settings
 
+# pandas и numpy импортируются при первом вызове методов DataMapper,
+# чтобы ConfigGenerator можно было использовать без них
+if TYPE_CHECKING:
+    import pandas as pd
+
 class DataMapper:
     """Класс для создания маппингов."""
 
     @staticmethod
-    def create_data_mapping(asset: str, signals: pd.DataFrame) -> dict:
+    def create_data_mapping(asset: str, signals: "pd.DataFrame") -> dict:
         """
         Создает словарь для конфига взаимосвязи между кодами в excel файле и эмуляторе.
         В данной реализации коды сигналов в excel файле соответствуют именам в эмуляторе.
@@ -33,21 +41,30 @@ class DataMapper:
         }
         """
 
-        mapping = {}
-        for _, row in signals.iterrows():
-            code = row[settings.CODE_COLUMN]
-            if settings.DIVIDE_DATA_BY_ASSET:
-                file_suffix = row[settings.ASSET_COLUMN]
-            else:
-                file_suffix = "all_assets"
-            mapping[code] = {
-                "type": row[settings.VALUE_TYPE_COLUMN],
-                "base": [f"{settings.EXCEL_DATA_NAME}_{file_suffix}.xlsx", code]
-            }
+        import numpy as np
+        import pandas as pd
+
+        codes = signals[settings.CODE_COLUMN].tolist()
+        value_types = signals[settings.VALUE_TYPE_COLUMN].tolist()
+
+        # Имена файлов данных формируются один раз для каждого ассета, а не для каждой строки:
+        if settings.DIVIDE_DATA_BY_ASSET:
+            asset_codes, assets = pd.factorize(signals[settings.ASSET_COLUMN], use_na_sentinel=False)
+            file_names = np.array(
+                [f"{settings.EXCEL_DATA_NAME}_{file_suffix}.{settings.DATA_TEMPLATE_FORMAT}" for file_suffix in assets],
+                dtype=object
+            )[asset_codes].tolist()
+        else:
+            file_names = [f"{settings.EXCEL_DATA_NAME}_all_assets.{settings.DATA_TEMPLATE_FORMAT}"] * len(codes)
+
+        mapping = {
+            code: {"type": value_type, "base": [file_name, code]}
+            for code, value_type, file_name in zip(codes, value_types, file_names)
+        }
         return mapping
 
     @staticmethod
-    def create_slaves_mapping(signals: pd.DataFrame) -> dict:
+    def create_slaves_mapping(signals: "pd.DataFrame") -> dict:
         """
         Создает словарь для маппинга в конфиге devices(датчиков) на их slave_id и содержащиеся в них регистры.
 
@@ -74,59 +91,195 @@ class DataMapper:
         }
         """
 
+        import numpy as np
+        import pandas as pd
+
+        # Группировка строк по устройствам за один проход: устройства нумеруются в порядке появления,
+        # стабильная сортировка сохраняет исходный порядок строк внутри каждого устройства.
+        device_codes, devices = pd.factorize(signals[settings.SIGNALS_SHEET_DEVICE_COLUMN], use_na_sentinel=False)
+        order = np.argsort(device_codes, kind="stable")
+        bounds = np.concatenate(([0], np.cumsum(np.bincount(device_codes, minlength=len(devices)))))
+
+        addresses = signals[settings.ADDRESS_COLUMN].to_numpy(dtype=object)[order]
+        codes = signals[settings.CODE_COLUMN].to_numpy(dtype=object)[order]
+        common_addresses = signals[settings.COMMON_ADDRESS_COLUMN].to_numpy(dtype=object)[order]
+
         mapping = {}
-        uniqe_device = signals[settings.SIGNALS_SHEET_DEVICE_COLUMN].unique()
-        for device in uniqe_device:
-            device_signals = signals.loc[signals[settings.SIGNALS_SHEET_DEVICE_COLUMN] == device]
+        for device, start, stop in zip(devices, bounds[:-1], bounds[1:]):
             mapping[device] = {
-                "slaveID": int(device_signals[settings.COMMON_ADDRESS_COLUMN].iloc[0]),
-                "holdings": device_signals.set_index(settings.ADDRESS_COLUMN)[settings.CODE_COLUMN].to_dict()
+                "slaveID": int(common_addresses[start]),
+                "holdings": dict(zip(addresses[start:stop].tolist(), codes[start:stop].tolist()))
             }
         return mapping
 
     @staticmethod
-    def create_signals_template(signals: pd.DataFrame) -> pd.DataFrame:
+    def get_template_codes(signals: "pd.DataFrame") -> list:
         """
-        Создает пустой DataFrame с колонками, соответствующими кодам сигналов из входного DataFrame.
+        Возвращает коды сигналов для заголовка шаблона данных (в порядке сигналов).
 
         Параметры:
         - signals: DataFrame, содержащий столбец с кодами сигналов.
 
         Возвращает:
-        - pd.DataFrame: Пустой DataFrame, колонки которого — коды сигналов.
+        - list: коды сигналов.
         """
 
         # Проверяем, содержит ли DataFrame необходимый столбец
         if settings.CODE_COLUMN not in signals.columns:
             raise ValueError(f"Входной DataFrame не содержит столбца '{settings.CODE_COLUMN}'.")
 
-        return pd.DataFrame(columns=signals[settings.CODE_COLUMN])
+        return signals[settings.CODE_COLUMN].tolist()
+
+    @staticmethod
+    def create_signals_template(signals: "pd.DataFrame") -> "pd.DataFrame":
+        """
+        Создает пустой DataFrame с колонками, соответствующими кодам сигналов из входного DataFrame.
+
+        Параметры:
+        - signals: DataFrame, содержащий столбец с кодами сигналов.
+
+        Возвращает:
+        - pd.DataFrame: Пустой DataFrame, колонки которого — коды сигналов.
+        """
+
+        import pandas as pd
+
+        return pd.DataFrame(columns=DataMapper.get_template_codes(signals))
 
 
 class ConfigGenerator:
     """Класс для генерации конифга эмулятора."""
 
     @staticmethod
-    def generate_config(data_mapping: dict, emulator_mapping: dict) -> dict:
+    def generate_config(
+            data_mapping: dict,
+            emulator_mapping: dict,
+            holdings_layout: str | None = None,
+            server_name: str = "Test",
+            port: int | None = None
+    ) -> dict:
         """
             Генерирует итоговый конфигурационный словарь для эмулятора.
 
             Параметры:
             data_mapping: dict, словарь с маппингом между кодами в excel файле и эмуляторе.
             emulator_mapping: dict, словарь с маппингом devices(датчиков) на их slave_id и регистры.
+            holdings_layout: формат регистров устройств: "flat" - словарь адрес -> код, "blocks" - список
+            блоков подряд идущих регистров {"start", "count", "codes"}. По умолчанию - HOLDINGS_LAYOUT из .env файла.
+            server_name: название сервера эмулятора.
+            port: порт сервера эмулятора. По умолчанию - первый порт из get_server_ports().
 
             Возвращает:
             - dict: Конфигурационный словарь, готовый для использования эмулятором.
             """
+        if (holdings_layout or settings.HOLDINGS_LAYOUT) == "blocks":
+            emulator_mapping = ConfigGenerator.create_register_blocks(emulator_mapping)
         config = {
             "signals": data_mapping,
             "servers": {
-                "Test": {
+                server_name: {
                     "host": settings.HOST,
-                    "port": settings.PORT,
+                    "port": ConfigGenerator.get_server_ports()[0] if port is None else port,
                     "period": [settings.HOURS, settings.MINUTES, settings.SECONDS],
                     "slaves": emulator_mapping
                 }
             }
         }
         return config
+
+    @staticmethod
+    def create_register_blocks(emulator_mapping: dict) -> dict:
+        """
+        Заменяет регистры каждого устройства блоками подряд идущих регистров (см. RegisterIndex).
+
+        Параметры:
+        - emulator_mapping: словарь с маппингом devices(датчиков) на их slave_id и регистры.
+
+        Возвращает:
+        - dict: словарь устройств, в котором "holdings" - список блоков регистров.
+        """
+
+        mapping = {}
+        for device, slave in emulator_mapping.items():
+            register_index = RegisterIndex(slave["holdings"])
+            register_index.log_collisions(device)
+            mapping[device] = {**slave, "holdings": register_index.to_config()}
+        return mapping
+
+    @staticmethod
+    def get_server_ports() -> list[int]:
+        """
+        Возвращает порты серверов эмулятора: SERVER_PORTS из .env файла, если список задан,
+        иначе SERVERS портов подряд, начиная с PORT.
+        """
+
+        if settings.SERVER_PORTS:
+            return list(settings.SERVER_PORTS)
+        return [settings.PORT + number for number in range(settings.SERVERS)]
+
+    @staticmethod
+    def is_sharded() -> bool:
+        """Проверяет, распределяются ли устройства по нескольким серверам эмулятора."""
+
+        return len(ConfigGenerator.get_server_ports()) > 1
+
+    @staticmethod
+    def shard_slaves(emulator_mapping: dict, shards: int) -> list[dict]:
+        """
+        Распределяет устройства по серверам так, чтобы количество регистров на серверах было близким:
+        устройства в порядке убывания количества регистров назначаются серверу с наименьшей нагрузкой
+        (жадный алгоритм LPT). Внутри сервера устройства идут в исходном порядке.
+
+        Параметры:
+        - emulator_mapping: словарь с маппингом devices(датчиков) на их slave_id и регистры.
+        - shards: количество серверов.
+
+        Возвращает:
+        - list: словари устройств для каждого сервера.
+        """
+
+        loads = [(0, shard) for shard in range(shards)]
+        shard_by_devices = {}
+        for device in sorted(emulator_mapping, key=lambda device: -len(emulator_mapping[device]["holdings"])):
+            load, shard = heapq.heappop(loads)
+            shard_by_devices[device] = shard
+            heapq.heappush(loads, (load + len(emulator_mapping[device]["holdings"]), shard))
+
+        slaves_by_shards = [{} for _ in range(shards)]
+        for device, slave in emulator_mapping.items():
+            slaves_by_shards[shard_by_devices[device]][device] = slave
+        return slaves_by_shards
+
+    @staticmethod
+    def generate_shard_configs(data_mapping: dict, emulator_mapping: dict) -> list[dict]:
+        """
+        Генерирует отдельный конфиг для каждого сервера эмулятора (порты - см. get_server_ports),
+        чтобы серверы можно было запускать в отдельных процессах. Конфиг сервера содержит его устройства
+        и сигналы их регистров; сигналы, не относящиеся ни к одному регистру, попадают в конфиг первого сервера.
+
+        Параметры:
+        - data_mapping: словарь с маппингом между кодами в excel файле и эмуляторе.
+        - emulator_mapping: словарь с маппингом devices(датчиков) на их slave_id и регистры.
+
+        Возвращает:
+        - list: конфигурационные словари серверов.
+        """
+
+        ports = ConfigGenerator.get_server_ports()
+        slaves_by_shards = ConfigGenerator.shard_slaves(emulator_mapping, len(ports))
+        shard_by_codes = {
+            code: shard
+            for shard, slaves in enumerate(slaves_by_shards)
+            for slave in slaves.values()
+            for code in slave["holdings"].values()
+        }
+        signals_by_shards = [{} for _ in ports]
+        for code, signal in data_mapping.items():
+            signals_by_shards[shard_by_codes.get(code, 0)][code] = signal
+
+        configs = []
+        for shard, (port, slaves, signals) in enumerate(zip(ports, slaves_by_shards, signals_by_shards), start=1):
+            if not slaves:
+                logging.warning(f"Для сервера {shard} (порт {port}) не хватило устройств, конфиг сервера пустой")
+            configs.append(ConfigGenerator.generate_config(signals, slaves, server_name=f"Test_{shard}", port=port))
+        return configs
@@ -1,22 +1,43 @@
-import json
-import pandas as pd
-from typing import NoReturn
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, Iterator, NoReturn
+from json_writer import JsonConfigWriter
+from output_planner import Artifact, OutputPlanner
 from settings import settings
+from template_writer import TemplateWriter
 import logging
 
 
 class FileCreator:
     """Класс для создания конфигурационных файлов."""
 
-    def __init__(self, asset: str, data_mapping: pd.DataFrame, config: dict):
+    def __init__(
+            self,
+            asset: str,
+            template_codes: Iterable | None,
+            config: dict | None,
+            shard_configs: list[dict] | None = None
+    ):
         """
-        file_type: Тип файла - "json" или "excel".
+        asset: Название ассета.
+        template_codes: Коды сигналов для заголовка шаблона данных (None, если шаблон для ассета не создается).
+        config: Конфигурационный словарь (None, если конфиг для ассета не создается).
+        shard_configs: Конфигурационные словари серверов эмулятора (если устройства распределены по нескольким
+        серверам), сохраняются в файлы с суффиксом _shard{номер сервера} вместо config.
         """
         self.asset = asset
-        self.data_mapping = data_mapping
+        self.template_codes = template_codes
         self.config = config
+        self.shard_configs = shard_configs
         self.json_file_name = settings.JSON_CONFIG_FILE.with_name(f"{settings.JSON_CONFIG_NAME}_{self.asset}.json")
-        self.excel_file_name = settings.EXCEL_DATA_FILE.with_name(f"{settings.EXCEL_DATA_NAME}_{self.asset}.xlsx")
+        self.shard_json_file_names = [
+            settings.JSON_CONFIG_FILE.with_name(f"{settings.JSON_CONFIG_NAME}_{self.asset}_shard{shard}.json")
+            for shard in range(1, len(shard_configs or []) + 1)
+        ]
+        self.excel_file_name = settings.EXCEL_DATA_FILE.with_name(
+            f"{settings.EXCEL_DATA_NAME}_{self.asset}.{settings.DATA_TEMPLATE_FORMAT}"
+        )
 
 
     def create_folder(func):
@@ -28,10 +49,25 @@ class FileCreator:
         return wrapper
 
 
+    @staticmethod
+    @contextmanager
+    def atomic_write(file_name: Path) -> Iterator[Path]:
+        """
+        Контекстный менеджер для атомарной записи файла: запись выполняется во временный файл
+        в той же папке, который после успешной записи заменяет итоговый файл.
+        """
+        tmp_file_name = file_name.with_name(f".{file_name.stem}.tmp{file_name.suffix}")
+        try:
+            yield tmp_file_name
+            os.replace(tmp_file_name, file_name)
+        finally:
+            tmp_file_name.unlink(missing_ok=True)
+
+
     @create_folder
     def create_json_with_config(self) -> NoReturn:
         """
-        Сохраняет конфигурационный словарь в JSON-файл.
+        Сохраняет конфигурационный словарь в JSON-файл (потоковая запись, отступ задается JSON_INDENT).
 
         Параметры:
         - config: dict, конфигурационный словарь для сохранения.
@@ -39,25 +75,38 @@ class FileCreator:
         Возвращает:
         - None
         """
-        if ((not settings.DIVIDE_CONFIG_BY_ASSET and self.asset == 'all_assets') or
-                (settings.DIVIDE_CONFIG_BY_ASSET and self.asset != 'all_assets')):
-            with open(self.json_file_name, "w", encoding="utf-8") as json_file:
-                json.dump(self.config, json_file, ensure_ascii=False, indent=4)
-                logging.info(f"Файл {self.json_file_name} успешно создан")
+        if Artifact.CONFIG in OutputPlanner.plan(self.asset):
+            if self.shard_configs is None:
+                self.write_json(self.json_file_name, self.config)
+            else:
+                for file_name, config in zip(self.shard_json_file_names, self.shard_configs):
+                    self.write_json(file_name, config)
+
+    @property
+    def json_file_names(self) -> list[Path]:
+        """Пути JSON-файлов с конфигами (по одному на сервер, если устройства распределены по серверам)."""
+        return [self.json_file_name] if self.shard_configs is None else self.shard_json_file_names
+
+    def write_json(self, file_name: Path, config: dict) -> None:
+        """Атомарно сохраняет конфигурационный словарь в JSON-файл."""
+        with self.atomic_write(file_name) as tmp_file_name:
+            with open(tmp_file_name, "wb") as json_file:
+                JsonConfigWriter(settings.JSON_INDENT).dump(config, json_file)
+        logging.info(f"Файл {file_name} успешно создан")
 
 
     @create_folder
     def create_excel_data_template(self) -> NoReturn:
         """
-        Сохраняет коды сигналов из DataFrame в Excel-файл.
+        Сохраняет коды сигналов в файл шаблона данных (формат задается DATA_TEMPLATE_FORMAT).
 
         Параметры:
-        - data_mapping: DataFrame, содержащий данные для сохранения в Excel.
+        - template_codes: коды сигналов для заголовка шаблона данных.
 
         Возвращает:
         - None
         """
-        if ((not settings.DIVIDE_DATA_BY_ASSET and self.asset == "all_assets") or
-                (settings.DIVIDE_DATA_BY_ASSET and self.asset != "all_assets")):
-            self.data_mapping.to_excel(self.excel_file_name)
+        if Artifact.DATA in OutputPlanner.plan(self.asset):
+            with self.atomic_write(self.excel_file_name) as tmp_file_name:
+                TemplateWriter.write(self.template_codes, tmp_file_name, settings.DATA_TEMPLATE_FORMAT)
             logging.info(f"Файл {self.excel_file_name} успешно создан")
@@ -0,0 +1,178 @@
+import cProfile
+import json
+import logging
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, Iterator
+from settings import settings
+
+try:
+    import resource
+except ImportError:
+    # Модуль resource недоступен в Windows
+    resource = None
+
+
+class PipelineMetrics:
+    """
+    Класс для сбора метрик этапов обработки: время выполнения, пиковая память и количество строк
+    на входе и выходе этапа (для этапов по ассетам - отдельно для каждого ассета).
+
+    Метрики собираются, если METRICS_ENABLED в .env файле в состоянии True; пиковая память
+    замеряется через tracemalloc только при METRICS_TRACK_MEMORY=True, так как это замедляет обработку.
+    """
+
+    def __init__(self):
+        self.records = []
+
+    @contextmanager
+    def stage(self, name: str, asset: str | None = None, rows_in: int | None = None) -> Iterator[dict]:
+        """
+        Контекстный менеджер для замера этапа. Количество строк на выходе этапа записывается
+        в ключ "rows_out" возвращаемого словаря.
+
+        Параметры:
+        - name: название этапа.
+        - asset: название ассета для этапов по ассетам.
+        - rows_in: количество строк на входе этапа.
+        """
+
+        record = {"stage": name, "asset": None if asset is None else str(asset), "rows_in": rows_in, "rows_out": None}
+        if not settings.METRICS_ENABLED:
+            yield record
+            return
+
+        track_memory = settings.METRICS_TRACK_MEMORY
+        if track_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            start_memory = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["seconds"] = time.perf_counter() - start
+            if track_memory:
+                record["peak_memory_mb"] = (tracemalloc.get_traced_memory()[1] - start_memory) / 2 ** 20
+            self.records.append(record)
+
+    def iterate(self, name: str, items: Iterable[tuple]) -> Iterator[tuple]:
+        """
+        Замеряет время получения каждого элемента ленивой последовательности пар (ассет, DataFrame),
+        например результата SignalProcessor.divide_by_assets.
+        """
+
+        iterator = iter(items)
+        while True:
+            with self.stage(name) as record:
+                item = next(iterator, None)
+                if item is not None:
+                    record["asset"] = str(item[0])
+                    record["rows_out"] = len(item[1])
+            if item is None:
+                if self.records and self.records[-1] is record:
+                    # Замер завершения последовательности не относится ни к одному ассету
+                    self.records.pop()
+                return
+            yield item
+
+    def pop_records(self) -> list[dict]:
+        """Возвращает собранные записи и очищает их (для передачи из рабочих процессов)."""
+
+        records, self.records = self.records, []
+        return records
+
+    def extend(self, records: list[dict]) -> None:
+        """Добавляет записи, собранные в рабочем процессе."""
+
+        self.records.extend(records)
+
+    def summarize(self) -> list[dict]:
+        """Суммирует метрики этапов по всем ассетам в порядке первого выполнения этапов."""
+
+        summary = {}
+        for record in self.records:
+            stage = summary.setdefault(record["stage"], defaultdict(float, stage=record["stage"], calls=0))
+            stage["calls"] += 1
+            stage["seconds"] += record["seconds"]
+            for key in ("rows_in", "rows_out"):
+                if record[key] is not None:
+                    stage[key] += record[key]
+            if "peak_memory_mb" in record:
+                stage["peak_memory_mb"] = max(stage["peak_memory_mb"], record["peak_memory_mb"])
+        return [dict(stage) for stage in summary.values()]
+
+    @staticmethod
+    def get_max_rss_mb() -> float | None:
+        """Возвращает максимальный объем резидентной памяти процесса в МБ (None, если недоступно)."""
+
+        if resource is None:
+            return None
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # В macOS значение возвращается в байтах, в Linux - в килобайтах
+        return max_rss / 2 ** 20 if sys.platform == "darwin" else max_rss / 2 ** 10
+
+    def log_report(self) -> None:
+        """Выводит в лог сводку по этапам (INFO) и метрики по ассетам (DEBUG)."""
+
+        if not self.records:
+            return
+        for record in self.records:
+            if record["asset"] is not None:
+                logging.debug(f"Этап {record['stage']} [{record['asset']}]: {self._format(record)}")
+        logging.info("Метрики этапов обработки:")
+        for stage in self.summarize():
+            calls = f" ({int(stage['calls'])} раз)" if stage["calls"] > 1 else ""
+            logging.info(f"  {stage['stage']}{calls}: {self._format(stage)}")
+        max_rss_mb = self.get_max_rss_mb()
+        if max_rss_mb is not None:
+            logging.info(f"  Максимальный объем памяти процесса: {max_rss_mb:.1f} МБ")
+
+    @staticmethod
+    def _format(record: dict) -> str:
+        text = f"{record['seconds']:.3f} с"
+        if record.get("peak_memory_mb") is not None:
+            text += f", пиковая память {record['peak_memory_mb']:.1f} МБ"
+        rows_in, rows_out = record.get("rows_in"), record.get("rows_out")
+        if rows_in is not None or rows_out is not None:
+            text += f", строк {'-' if rows_in is None else int(rows_in)} -> {'-' if rows_out is None else int(rows_out)}"
+        return text
+
+    def export(self, path: Path) -> None:
+        """Сохраняет метрики по этапам, по ассетам и сводку в JSON-файл."""
+
+        path = Path(path)
+        path.parent.mkdir(exist_ok=True, parents=True)
+        report = {
+            "summary": self.summarize(),
+            "stages": self.records,
+            "max_rss_mb": self.get_max_rss_mb()
+        }
+        path.write_text(json.dumps(report, ensure_ascii=False, indent=4), encoding="utf-8")
+        logging.info(f"Метрики сохранены в файл {path}")
+
+
+@contextmanager
+def profile(path: Path | None) -> Iterator[None]:
+    """Профилирует выполнение блока через cProfile и сохраняет статистику в файл (если путь задан)."""
+
+    if path is None:
+        yield
+        return
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        Path(path).parent.mkdir(exist_ok=True, parents=True)
+        profiler.dump_stats(path)
+        logging.info(f"Профиль выполнения сохранен в файл {path}")
+
+
+metrics = PipelineMetrics()
@@ -0,0 +1,151 @@
+import json
+from json.encoder import encode_basestring
+from typing import BinaryIO
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JsonConfigWriter:
+    """
+    Класс для потоковой записи конфига эмулятора в JSON.
+
+    Вложенные словари (signals, servers, slaves) записываются в файл поэлементно, без построения
+    строки со всем конфигом. Словари, значения которых не содержат словарей (описание сигнала,
+    holdings устройства), сериализуются целиком. При indent=0 файл записывается в компактном виде
+    без отступов и пробелов. При наличии пакета orjson и indent 0 или 2 целые разделы конфига
+    (все сигналы, все устройства сервера) сериализуются одним вызовом orjson. orjson записывает NaN
+    (отсутствующие коды и гейтвеи) как null, поэтому раздел, в результате которого встречается null,
+    записывается стандартным модулем json.
+    """
+
+    def __init__(self, indent: int = 4):
+        """
+        indent: Количество пробелов в отступе (0 - компактная запись).
+        """
+        self.indent = indent
+        self.use_orjson = orjson is not None and indent in (0, 2)
+        # Компактный кодировщик (реализован на C в стандартной библиотеке) создается один раз на весь файл;
+        # отступы для небольших вложенных значений расставляются в _encode_indented
+        self.encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+    def dump(self, config: dict, file: BinaryIO) -> None:
+        """
+        Записывает конфиг в файл, открытый в бинарном режиме.
+
+        Параметры:
+        - config: конфигурационный словарь.
+        - file: файл для записи.
+        """
+
+        self._write_value(config, file, 0)
+
+    def _encode(self, value, level: int) -> bytes:
+        """Сериализует значение целиком с учетом текущего уровня вложенности."""
+
+        if self.indent:
+            return self._encode_indented(value, level).encode("utf-8")
+        return self.encoder.encode(value).encode("utf-8")
+
+    def _encode_section(self, value: dict, level: int) -> bytes:
+        """
+        Сериализует раздел конфига через orjson. Если в результате есть null (NaN, который стандартный
+        модуль json записывает как NaN, или None), раздел сериализуется стандартным модулем json.
+        """
+
+        option = orjson.OPT_NON_STR_KEYS
+        if self.indent:
+            option |= orjson.OPT_INDENT_2
+        encoded = orjson.dumps(value, option=option)
+        if b"null" in encoded:
+            return self._encode(value, level)
+        if self.indent and level:
+            encoded = encoded.replace(b"\n", b"\n" + b" " * (self.indent * level))
+        return encoded
+
+    @staticmethod
+    def _is_collection(value) -> bool:
+        """Проверяет, что значение - непустой словарь словарей (signals, servers, slaves)."""
+
+        return isinstance(value, dict) and bool(value) and all(isinstance(item, dict) for item in value.values())
+
+    @staticmethod
+    def _is_leaf_section(value) -> bool:
+        """
+        Проверяет, что значение - словарь словарей, элементы которого не содержат словарей словарей
+        (все сигналы, все устройства сервера). Элементы раздела однородны, поэтому проверяется первый.
+        """
+
+        if not JsonConfigWriter._is_collection(value):
+            return False
+        first = next(iter(value.values()))
+        return not any(JsonConfigWriter._is_collection(item) for item in first.values())
+
+    def _encode_indented(self, value, level: int) -> str:
+        """Сериализует значение с отступами в том же формате, что и json.dumps(indent=...)."""
+
+        if isinstance(value, str):
+            return encode_basestring(value)
+        if isinstance(value, dict):
+            items = [
+                f"{encode_basestring(self._encode_key(key))}: {self._encode_indented(item, level + 1)}"
+                for key, item in value.items()
+            ]
+            brackets = "{}"
+        elif isinstance(value, (list, tuple)):
+            items = [self._encode_indented(item, level + 1) for item in value]
+            brackets = "[]"
+        else:
+            return self.encoder.encode(value)
+        if not items:
+            return brackets
+        inner_indent = "\n" + " " * (self.indent * (level + 1))
+        outer_indent = "\n" + " " * (self.indent * level)
+        return f"{brackets[0]}{inner_indent}{(',' + inner_indent).join(items)}{outer_indent}{brackets[1]}"
+
+    @staticmethod
+    def _encode_key(key) -> str:
+        """Приводит ключ словаря к строке по правилам модуля json."""
+
+        if isinstance(key, str):
+            return key
+        if key is True:
+            return "true"
+        if key is False:
+            return "false"
+        if key is None:
+            return "null"
+        if isinstance(key, float):
+            return json.dumps(key)
+        return str(key)
+
+    def _write_value(self, value, file: BinaryIO, level: int) -> None:
+        """Записывает значение, разворачивая поэлементно словари, содержащие вложенные словари."""
+
+        if self.use_orjson and self._is_leaf_section(value):
+            file.write(self._encode_section(value, level))
+            return
+        if not isinstance(value, dict) or not value or not any(isinstance(item, dict) for item in value.values()):
+            file.write(self._encode(value, level))
+            return
+
+        if self.indent:
+            opening = b"\n" + b" " * (self.indent * (level + 1))
+            closing = b"\n" + b" " * (self.indent * level)
+            key_separator = b": "
+        else:
+            opening = closing = b""
+            key_separator = b":"
+
+        file.write(b"{")
+        for index, (key, item) in enumerate(value.items()):
+            if index:
+                file.write(b",")
+            file.write(opening)
+            file.write(self._encode(self._encode_key(key), 0))
+            file.write(key_separator)
+            self._write_value(item, file, level + 1)
+        file.write(closing)
+        file.write(b"}")
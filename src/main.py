@@ -1,8 +1,5 @@
 import logging
-from data_loader import DataLoader, DataConstructor
-from signal_processor import SignalProcessor
-from data_mapper import DataMapper, ConfigGenerator
-from file_creator import FileCreator
+from instrumentation import metrics, profile
 from settings import settings
 
 
@@ -13,46 +10,74 @@ logging.basicConfig(
     encoding='utf-8'
 )
 
-def main():
-    # Загрузка данных
-    data_loader = DataLoader(settings.LIST_OF_SIGNALS_FILE)
-    signals_data = data_loader.load_signals()
-    devices_data = data_loader.load_devices()
-    logging.info(
-        f"Данные загружены: signals ({signals_data.shape[0]} строк), devices ({devices_data.shape[0]} строк)."
-    )
-
-    # Объединение данных
-    merged_data = DataConstructor.merge(signals_data, devices_data)
-    logging.debug("Данные сигналов и устройств объединены.")
+def process_signals_file():
+    # Создание только конфигов без pandas включается явно, модули, использующие pandas, в этом случае не импортируются:
+    if settings.PANDAS_FREE_CONFIGS:
+        if settings.CREATE_DATA_TEMPLATES:
+            logging.warning("PANDAS_FREE_CONFIGS используется только при CREATE_DATA_TEMPLATES=False и не учитывается")
+        else:
+            from config_only import ConfigOnlyPipeline
+
+            ConfigOnlyPipeline.run()
+            logging.info("Все файлы созданы")
+            return
+
+    from asset_processor import AssetProcessor
+    from data_cache import DataCache
+    from data_loader import DataLoader, DataConstructor
+    from signal_processor import SignalProcessor
+
+    # Загрузка данных из кэша:
+    data_cache = DataCache(settings.LIST_OF_SIGNALS_FILE)
+    merged_data = None
+    if settings.CACHE_ENABLED:
+        with metrics.stage("DataCache.load") as stage:
+            merged_data = data_cache.load()
+            stage["rows_out"] = None if merged_data is None else len(merged_data)
+    if merged_data is not None:
+        logging.info(f"Данные загружены из кэша: {merged_data.shape[0]} строк.")
+    else:
+        # Загрузка данных
+        with metrics.stage("DataLoader.load") as stage:
+            data_loader = DataLoader(settings.LIST_OF_SIGNALS_FILE)
+            signals_data, devices_data = data_loader.load()
+            stage["rows_out"] = len(signals_data) + len(devices_data)
+        logging.info(
+            f"Данные загружены: signals ({signals_data.shape[0]} строк), devices ({devices_data.shape[0]} строк)."
+        )
+
+        # Объединение данных
+        with metrics.stage("DataConstructor.merge", rows_in=len(signals_data)) as stage:
+            merged_data = DataConstructor.merge(signals_data, devices_data)
+            stage["rows_out"] = len(merged_data)
+        logging.debug("Данные сигналов и устройств объединены.")
+        if settings.CACHE_ENABLED:
+            with metrics.stage("DataCache.save", rows_in=len(merged_data)):
+                data_cache.save(merged_data)
 
     # Обработка сигналов:
     processor = SignalProcessor()
-    filtered_signals = processor.filter_signals(merged_data)
-    grouped_signals = processor.group_signals(filtered_signals)
-    signals_with_concatenated_devices = processor.concatenate_devices(grouped_signals)
-    normalize_signals = processor.fill_missing_data_types(signals_with_concatenated_devices)
-    signals_divided_by_assets = processor.divide_by_assets(normalize_signals)
-
-    # Создание маппингов:
-    for asset, signals in signals_divided_by_assets.items():
-        data_mapper = DataMapper()
-        data_mapping = data_mapper.create_data_mapping(asset, signals)
-        slaves_mapping = data_mapper.create_slaves_mapping(signals)
-        signals_template = data_mapper.create_signals_template(signals)
-        logging.debug(f"Маппинги для {asset} созданы")
-
-        # Генерация конифга:
-        config_generator = ConfigGenerator()
-        config = config_generator.generate_config(data_mapping, slaves_mapping)
-        logging.debug(f"Конфиг для ассета {asset} сгенерирован")
-
-        # Создание файлов:
-        file_creator = FileCreator(asset, signals_template, config)
-        file_creator.create_json_with_config()
-        file_creator.create_excel_data_template()
+    with metrics.stage("SignalProcessor.process", rows_in=len(merged_data)) as stage:
+        signals = processor.process(merged_data)
+        stage["rows_out"] = len(signals)
+    signals_divided_by_assets = metrics.iterate("SignalProcessor.divide_by_assets", processor.divide_by_assets(signals))
+
+    # Создание маппингов, конфигов и файлов по ассетам:
+    AssetProcessor.process_all(signals_divided_by_assets)
     logging.info("Все файлы созданы")
 
 
+def main():
+    metrics.pop_records()
+    try:
+        with profile(settings.PROFILE_FILE):
+            process_signals_file()
+    finally:
+        if settings.METRICS_ENABLED:
+            metrics.log_report()
+            if settings.METRICS_FILE:
+                metrics.export(settings.METRICS_FILE)
+
+
 if __name__ == "__main__":
     main()
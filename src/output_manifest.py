@@ -0,0 +1,235 @@
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+from output_planner import Artifact, OutputPlanner
+from settings import settings
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Версия манифеста: увеличивается при изменении формата манифеста или создаваемых файлов
+MANIFEST_VERSION = 2
+
+# Настройки, влияющие на содержимое файлов каждого типа (кроме сигналов ассета)
+HASH_SETTINGS = {
+    Artifact.CONFIG: (
+        "DIVIDE_DATA_BY_ASSET",
+        "EXCEL_DATA_NAME",
+        "DATA_TEMPLATE_FORMAT",
+        "JSON_CONFIG_NAME",
+        "JSON_INDENT",
+        "HOLDINGS_LAYOUT",
+        "HOST",
+        "PORT",
+        "SERVERS",
+        "SERVER_PORTS",
+        "HOURS",
+        "MINUTES",
+        "SECONDS",
+    ),
+    Artifact.DATA: (
+        "EXCEL_DATA_NAME",
+        "DATA_TEMPLATE_FORMAT",
+    ),
+}
+
+# Настройки с названиями столбцов сигналов, от которых зависит содержимое файлов каждого типа
+HASH_COLUMNS = {
+    Artifact.CONFIG: (
+        "SIGNALS_SHEET_DEVICE_COLUMN",
+        "CODE_COLUMN",
+        "ADDRESS_COLUMN",
+        "VALUE_TYPE_COLUMN",
+        "ASSET_COLUMN",
+        "COMMON_ADDRESS_COLUMN",
+    ),
+    Artifact.DATA: (
+        "CODE_COLUMN",
+    ),
+}
+
+
+class OutputManifest:
+    """
+    Класс манифеста созданных файлов для инкрементального обновления результатов.
+
+    Манифест хранится в папке с результатами и содержит для каждого ассета и типа файлов (конфиг,
+    шаблон данных) хэш сигналов и настроек, от которых зависит содержимое этих файлов, а также список
+    созданных файлов. При повторном запуске файлы создаются заново только при изменении их хэша
+    или отсутствии какого-либо из файлов (например, изменение PORT не пересоздает шаблоны данных);
+    файлы ассетов, которых больше нет в результатах, удаляются. Файлы типов, которые в текущем запуске не создаются
+    (шаблоны данных при CREATE_DATA_TEMPLATES=False), не удаляются и переносятся в новый манифест.
+    """
+
+    FILE_NAME = ".manifest.json"
+
+    def __init__(self, output_dir: Path | None = None):
+        self.output_dir = Path(output_dir or settings.OUTPUT_FILES_DIR)
+        self.path = self.output_dir / self.FILE_NAME
+        self.previous = self._load()
+        self.current = {}
+        self.planned = OutputPlanner.planned_artifacts()
+
+    def _load(self) -> dict:
+        """Загружает манифест предыдущего запуска (пустой, если манифест отсутствует или устарел)."""
+
+        try:
+            manifest = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if manifest.get("version") != MANIFEST_VERSION:
+            return {}
+        return manifest.get("assets", {})
+
+    @staticmethod
+    def get_settings_fingerprint(artifact: Artifact) -> str:
+        """Возвращает строковое представление настроек, влияющих на содержимое файлов этого типа."""
+
+        values = settings.model_dump(mode="json", include=set(HASH_SETTINGS[artifact]))
+        return json.dumps(values, sort_keys=True, ensure_ascii=False)
+
+    @staticmethod
+    def get_hash_columns(asset: str) -> list[str]:
+        """
+        Возвращает названия настроек со столбцами сигналов (HASH_COLUMNS), от которых зависит
+        содержимое создаваемых для ассета файлов.
+        """
+
+        return list(dict.fromkeys(name for artifact in OutputPlanner.plan(asset) for name in HASH_COLUMNS[artifact]))
+
+    @staticmethod
+    def compute_hashes(asset: str, signals: "pd.DataFrame") -> dict[Artifact, str]:
+        """
+        Вычисляет хэши сигналов ассета и настроек для каждого создаваемого для ассета типа файлов.
+
+        Значения хэшируются в строковом виде, поэтому хэш не зависит от типов столбцов
+        (например, адрес 100 типа Int64 и категориальный адрес "100" дают одинаковый хэш)
+        и совпадает с хэшем compute_rows_hashes для тех же сигналов.
+
+        Параметры:
+        - asset: название ассета.
+        - signals: DataFrame сигналов ассета.
+
+        Возвращает:
+        - dict: шестнадцатеричный sha256-хэш для каждого типа файлов Artifact.
+        """
+
+        columns = {
+            name: signals[getattr(settings, name)].astype("string").to_numpy(dtype=object, na_value=None).tolist()
+            for name in OutputManifest.get_hash_columns(asset)
+        }
+        return OutputManifest.compute_rows_hashes(asset, columns)
+
+    @staticmethod
+    def compute_rows_hashes(asset: str, columns: dict[str, list]) -> dict[Artifact, str]:
+        """
+        Вычисляет хэши сигналов ассета и настроек по значениям столбцов (без pandas).
+
+        Параметры:
+        - asset: название ассета.
+        - columns: значения столбцов в виде строк (None - отсутствующее значение) по названиям
+          настроек со столбцами из get_hash_columns.
+
+        Возвращает:
+        - dict: шестнадцатеричный sha256-хэш для каждого типа файлов Artifact.
+        """
+
+        hashes = {}
+        for artifact in OutputPlanner.plan(asset):
+            artifact_hash = hashlib.sha256()
+            artifact_hash.update(f"{MANIFEST_VERSION}:{artifact.value}:{asset}:".encode("utf-8"))
+            artifact_hash.update(OutputManifest.get_settings_fingerprint(artifact).encode("utf-8"))
+            rows = list(zip(*(columns[name] for name in HASH_COLUMNS[artifact])))
+            artifact_hash.update(json.dumps(rows, ensure_ascii=False).encode("utf-8"))
+            hashes[artifact] = artifact_hash.hexdigest()
+        return hashes
+
+    def get_outdated(self, asset: str, hashes: dict[Artifact, str]) -> set[Artifact]:
+        """
+        Возвращает типы файлов ассета, которые необходимо создать заново: хэш изменился
+        или какой-либо из файлов отсутствует. Записи остальных типов переносятся в новый манифест.
+        """
+
+        previous_entries = self.previous.get(str(asset), {})
+        outdated = set()
+        for artifact, artifact_hash in hashes.items():
+            entry = previous_entries.get(artifact.value)
+            if (
+                entry is not None and
+                entry["hash"] == artifact_hash and
+                all((self.output_dir / file_name).exists() for file_name in entry["files"])
+            ):
+                self.current.setdefault(str(asset), {})[artifact.value] = entry
+            else:
+                outdated.add(artifact)
+        return outdated
+
+    def update(self, asset: str, artifact: Artifact, artifact_hash: str | None, files: list[Path]) -> None:
+        """
+        Записывает в манифест хэш и созданные файлы ассета одного типа.
+
+        Параметры:
+        - asset: название ассета.
+        - artifact: тип файлов.
+        - artifact_hash: хэш; None - файлы не созданы из-за ошибки и будут созданы при следующем запуске.
+        - files: пути созданных файлов.
+        """
+
+        self.current.setdefault(str(asset), {})[artifact.value] = {
+            "hash": artifact_hash,
+            "files": [Path(file).name for file in files]
+        }
+
+    def mark_failed(self, asset: str, artifacts: set[Artifact]) -> None:
+        """Помечает файлы ассета для повторного создания, сохраняя файлы предыдущего запуска."""
+
+        previous_entries = self.previous.get(str(asset), {})
+        for artifact in artifacts:
+            self.update(asset, artifact, None, previous_entries.get(artifact.value, {}).get("files", []))
+
+    def carry_unplanned(self) -> None:
+        """
+        Переносит из манифеста предыдущего запуска файлы типов, которые в текущем запуске не создаются
+        (например, шаблоны данных при CREATE_DATA_TEMPLATES=False): на них ссылаются конфиги,
+        и в них могут быть внесены данные.
+        """
+
+        for asset, entries in self.previous.items():
+            for artifact in Artifact:
+                if artifact not in self.planned and artifact.value in entries:
+                    self.current.setdefault(asset, {}).setdefault(artifact.value, entries[artifact.value])
+
+    def remove_orphans(self) -> None:
+        """
+        Удаляет файлы из манифеста предыдущего запуска, которые не созданы в текущем запуске.
+        Удаляются только файлы типов, создаваемых в текущем запуске.
+        """
+
+        current_files = {
+            file_name
+            for entries in self.current.values()
+            for entry in entries.values()
+            for file_name in entry["files"]
+        }
+        for entries in self.previous.values():
+            for artifact in self.planned:
+                for file_name in entries.get(artifact.value, {}).get("files", []):
+                    if file_name not in current_files:
+                        (self.output_dir / file_name).unlink(missing_ok=True)
+                        logging.info(f"Устаревший файл {self.output_dir / file_name} удален")
+
+    def save(self) -> None:
+        """Удаляет устаревшие файлы и атомарно сохраняет манифест."""
+
+        self.carry_unplanned()
+        self.remove_orphans()
+        self.output_dir.mkdir(exist_ok=True, parents=True)
+        tmp_path = self.path.with_name(f"{self.FILE_NAME}.tmp")
+        tmp_path.write_text(
+            json.dumps({"version": MANIFEST_VERSION, "assets": self.current}, ensure_ascii=False, indent=4),
+            encoding="utf-8"
+        )
+        os.replace(tmp_path, self.path)
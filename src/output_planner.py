@@ -0,0 +1,63 @@
+from enum import Enum
+from settings import settings
+
+
+class Artifact(Enum):
+    """Типы создаваемых файлов."""
+
+    CONFIG = "config"
+    DATA = "data"
+
+
+class OutputPlanner:
+    """
+    Класс для планирования создаваемых файлов.
+
+    Определяет заранее, какие файлы (конфиг, шаблон данных) будут созданы для каждого ассета
+    в соответствии с настройками DIVIDE_CONFIG_BY_ASSET и DIVIDE_DATA_BY_ASSET, чтобы не вычислять
+    маппинги, конфиги и шаблоны, которые не будут сохранены.
+    """
+
+    @staticmethod
+    def plan(asset: str) -> set[Artifact]:
+        """
+        Возвращает множество файлов, которые будут созданы для ассета.
+
+        Параметры:
+        - asset: название ассета ("all_assets" - для всех сигналов).
+
+        Возвращает:
+        - set: множество типов файлов Artifact.
+        """
+
+        is_all_assets = asset == "all_assets"
+        artifacts = set()
+        if settings.DIVIDE_CONFIG_BY_ASSET != is_all_assets:
+            artifacts.add(Artifact.CONFIG)
+        if settings.CREATE_DATA_TEMPLATES and settings.DIVIDE_DATA_BY_ASSET != is_all_assets:
+            artifacts.add(Artifact.DATA)
+        return artifacts
+
+    @staticmethod
+    def planned_artifacts() -> set[Artifact]:
+        """Возвращает типы файлов, которые создаются в текущем запуске хотя бы для одного ассета."""
+
+        artifacts = {Artifact.CONFIG}
+        if settings.CREATE_DATA_TEMPLATES:
+            artifacts.add(Artifact.DATA)
+        return artifacts
+
+    @staticmethod
+    def needs_all_assets() -> bool:
+        """Проверяет, создается ли хотя бы один файл для всех сигналов (all_assets)."""
+
+        return (
+            not settings.DIVIDE_CONFIG_BY_ASSET or
+            (settings.CREATE_DATA_TEMPLATES and not settings.DIVIDE_DATA_BY_ASSET)
+        )
+
+    @staticmethod
+    def needs_asset_partitions() -> bool:
+        """Проверяет, создается ли хотя бы один файл по отдельным ассетам."""
+
+        return settings.DIVIDE_CONFIG_BY_ASSET or (settings.CREATE_DATA_TEMPLATES and settings.DIVIDE_DATA_BY_ASSET)
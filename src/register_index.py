@@ -0,0 +1,62 @@
+import logging
+from typing import NamedTuple
+
+
+class RegisterBlock(NamedTuple):
+    """Блок подряд идущих регистров: адрес первого регистра и коды сигналов всех регистров блока."""
+
+    start: int
+    codes: list
+
+    @property
+    def count(self) -> int:
+        return len(self.codes)
+
+
+class RegisterIndex:
+    """
+    Индекс регистров одного устройства (slave): адреса сортируются, повторяющиеся адреса выявляются,
+    а соседние адреса объединяются в непрерывные блоки, чтобы эмулятор обслуживал чтение блока
+    регистров одним поиском вместо поиска каждого адреса (поиск выполняется на стороне эмулятора).
+    """
+
+    def __init__(self, holdings: dict):
+        """
+        holdings: словарь адрес регистра -> код сигнала (адреса - целые числа или их строковые записи).
+
+        Исключения:
+        - ValueError: если адрес регистра не является целым числом.
+        """
+
+        registers = {}
+        # Адреса, записанные по-разному (например, "0100" и "100"), указывают на один регистр:
+        self.collisions = {}
+        for address, code in holdings.items():
+            try:
+                register = int(address)
+            except (TypeError, ValueError):
+                raise ValueError(f"Адрес регистра {address!r} не является целым числом") from None
+            if register in registers and registers[register] != code:
+                self.collisions.setdefault(register, [registers[register]]).append(code)
+            registers[register] = code
+
+        self.blocks = []
+        for register in sorted(registers):
+            if self.blocks and self.blocks[-1].start + self.blocks[-1].count == register:
+                self.blocks[-1].codes.append(registers[register])
+            else:
+                self.blocks.append(RegisterBlock(register, [registers[register]]))
+
+    def to_config(self) -> list[dict]:
+        """Возвращает блоки регистров для конфига эмулятора."""
+
+        return [{"start": block.start, "count": block.count, "codes": block.codes} for block in self.blocks]
+
+    def log_collisions(self, device: str) -> None:
+        """Выводит в лог регистры устройства, которым заданы несколько сигналов (используется последний)."""
+
+        for register, codes in self.collisions.items():
+            logging.warning(
+                f"Регистру {register} устройства {device} заданы несколько сигналов: "
+                f"{', '.join(map(str, codes))}. Используется {codes[-1]}"
+            )
@@ -1,4 +1,7 @@
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Iterator, Literal
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -8,15 +11,42 @@ class Settings(BaseSettings):
     INPUT_FILES_DIR: Path = BASE_DIR / "input_files"
     OUTPUT_FILES_DIR: Path = BASE_DIR / "output_files"
 
+    # Кэш загруженных данных:
+    CACHE_ENABLED: bool = True
+    CACHE_DIR: Path = BASE_DIR / ".cache"
+    CACHE_MAX_ENTRIES: int = 10
+
     # Логика деления на файлы:
     DIVIDE_CONFIG_BY_ASSET: bool = True
     DIVIDE_DATA_BY_ASSET: bool = True
 
+    # Создание файлов только для изменившихся ассетов (по манифесту в папке с результатами):
+    INCREMENTAL_OUTPUT: bool = True
+
     # Названия файлов:
-    LIST_OF_SIGNALS_NAME: str
+    LIST_OF_SIGNALS_NAME: str | None = None
     EXCEL_DATA_NAME: str = "data"
     JSON_CONFIG_NAME: str = "config"
 
+    # Создание шаблонов данных (при False создаются только JSON-конфиги):
+    CREATE_DATA_TEMPLATES: bool = True
+
+    # Создание только JSON-конфигов без pandas (при CREATE_DATA_TEMPLATES=False): быстрее запускается,
+    # но не использует кэш загруженных данных и пул процессов (CACHE_ENABLED, WORKERS):
+    PANDAS_FREE_CONFIGS: bool = False
+
+    # Формат регистров устройств в конфиге: flat - словарь адрес -> код, blocks - блоки подряд идущих регистров:
+    HOLDINGS_LAYOUT: Literal["flat", "blocks"] = "flat"
+
+    # Формат шаблона данных (xlsx, csv, parquet):
+    DATA_TEMPLATE_FORMAT: Literal["xlsx", "csv", "parquet"] = "xlsx"
+
+    # Отступ в JSON-конфиге (0 - компактная запись без отступов):
+    JSON_INDENT: int = 4
+
+    # Движок чтения excel файла (openpyxl, calamine); если не задан - выбирается автоматически:
+    EXCEL_ENGINE: str | None = None
+
     # Названия страниц в excel файле:
     SIGNALS_SHEET: str = "signals"
     DEVICES_SHEET: str = "devices"
@@ -40,18 +70,66 @@ class Settings(BaseSettings):
     HOST: str = "0.0.0.0"
     PORT: int = 502
 
+    # Распределение устройств по нескольким серверам эмулятора (отдельный конфиг для каждого сервера):
+    # SERVERS серверов на портах подряд, начиная с PORT, или серверы на портах из списка SERVER_PORTS
+    SERVERS: int = Field(default=1, ge=1)
+    SERVER_PORTS: list[int] = []
+
     # Конфигурирование таймера эмулятора:
     HOURS: int = 0
     MINUTES: int = 10
     SECONDS: int = 0
 
+    # Количество процессов для создания файлов по ассетам (1 - последовательно, 0 - по числу ядер):
+    WORKERS: int = 1
+
+    # Количество процессов для пакетной обработки всех списков сигналов в INPUT_FILES_DIR (0 - по числу ядер):
+    BATCH_WORKERS: int = 0
+
+    # Режим отслеживания изменений (watch.py): период опроса файлов и время ожидания завершения сохранения, с:
+    WATCH_INTERVAL: float = 1.0
+    WATCH_DEBOUNCE: float = 0.5
+
+    # Метрики этапов обработки (время, пиковая память, количество строк) и профилирование:
+    METRICS_ENABLED: bool = False
+    METRICS_TRACK_MEMORY: bool = False
+    METRICS_FILE: Path | None = None
+    PROFILE_FILE: Path | None = None
+
     # Уровень логгирования:
     LOGGING_LEVEL: str = 'INFO'
 
     model_config = SettingsConfigDict(env_file=BASE_DIR / ".env", env_file_encoding="utf-8")
 
+    def override(self, **values) -> None:
+        """Переопределяет значения настроек (например, в рабочих процессах)."""
+        for name, value in values.items():
+            setattr(self, name, value)
+
+    @contextmanager
+    def overridden(self, **values) -> Iterator["Settings"]:
+        """
+        Контекстный менеджер, временно переопределяющий значения настроек. Значения проверяются
+        и приводятся к типам полей так же, как при чтении из .env файла.
+
+        Исключения:
+        - ValidationError: если значение не соответствует типу поля.
+        """
+        unknown = set(values) - set(type(self).model_fields)
+        if unknown:
+            raise ValueError(f"Неизвестные настройки: {', '.join(sorted(unknown))}")
+        validated = type(self).model_validate({**self.model_dump(), **values})
+        previous = {name: getattr(self, name) for name in values}
+        self.override(**{name: getattr(validated, name) for name in values})
+        try:
+            yield self
+        finally:
+            self.override(**previous)
+
     @property
     def LIST_OF_SIGNALS_FILE(self):
+        if self.LIST_OF_SIGNALS_NAME is None:
+            raise ValueError("Не задано имя файла со списком сигналов (LIST_OF_SIGNALS_NAME в .env файле)")
         return self.INPUT_FILES_DIR / self.LIST_OF_SIGNALS_NAME
 
     @property
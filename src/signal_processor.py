@@ -1,5 +1,7 @@
+from typing import Iterator
 import numpy as np
 import pandas as pd
+from output_planner import OutputPlanner
 from settings import settings
 import logging
 
@@ -45,15 +47,21 @@ class SignalProcessor:
         signals = signals.copy()
 
         # Вычисление количества записей для каждой комбинации 'address' и 'common_address':
-        group_counts = signals.groupby([settings.ADDRESS_COLUMN, settings.COMMON_ADDRESS_COLUMN]).transform('size')
+        # (группировка выполняется по целочисленным адресам и кодам категорий):
+        group_counts = signals.groupby(
+            [settings.ADDRESS_COLUMN, settings.COMMON_ADDRESS_COLUMN],
+            observed=True
+        ).transform('size')
+
+        # Строковые операции выполняются над значениями, а не над категориями:
+        gateways = signals[settings.GATEWAY_COLUMN].astype(object)
+        addresses = signals[settings.ADDRESS_COLUMN].astype(str)
 
         # Изменение столбца code:
         signals[settings.CODE_COLUMN] = np.where(
             group_counts > 1,
-            group_counts.astype(str) + '_signals_' +
-            signals[settings.GATEWAY_COLUMN] + '_' +
-            signals[settings.ADDRESS_COLUMN],
-            signals[settings.CODE_COLUMN] + '_' + signals[settings.GATEWAY_COLUMN]
+            group_counts.astype(str) + '_signals_' + gateways + '_' + addresses,
+            signals[settings.CODE_COLUMN] + '_' + gateways
         )
 
         # Удаление дубликатов:
@@ -78,10 +86,11 @@ class SignalProcessor:
 
         # Конкатенация названий устройств
         signals[settings.SIGNALS_SHEET_DEVICE_COLUMN] = signals.groupby(
-            settings.COMMON_ADDRESS_COLUMN
+            settings.COMMON_ADDRESS_COLUMN,
+            observed=True
         )[settings.SIGNALS_SHEET_DEVICE_COLUMN].transform(
             lambda x: ', '.join(x.unique())
-        )
+        ).astype("category")
         return signals
 
     @staticmethod
@@ -100,31 +109,130 @@ class SignalProcessor:
         if missing_count > 0:
             logging.warning(f"В столбце {settings.VALUE_TYPE_COLUMN} отсутствуют значения в {missing_count} строчках")
             # Заполнение отсутствующих значений:
-            signals.loc[:, settings.VALUE_TYPE_COLUMN] = signals[settings.VALUE_TYPE_COLUMN].fillna('hfloat')
+            value_types = signals[settings.VALUE_TYPE_COLUMN]
+            if isinstance(value_types.dtype, pd.CategoricalDtype) and 'hfloat' not in value_types.cat.categories:
+                value_types = value_types.cat.add_categories('hfloat')
+            signals = signals.assign(**{settings.VALUE_TYPE_COLUMN: value_types.fillna('hfloat')})
             logging.info(f"{missing_count} сигналам установлен тип hfloat")
         else:
             logging.info(f"Отсутствующие значения в столбце {settings.VALUE_TYPE_COLUMN} не обнаружены.")
         return signals
 
     @staticmethod
-    def divide_by_assets(signals: pd.DataFrame) -> dict[str, pd.DataFrame]:
+    def process(signals: pd.DataFrame) -> pd.DataFrame:
+        """
+        Выполняет за один проход шаги filter_signals, group_signals, concatenate_devices и fill_missing_data_types
+        с тем же результатом, что и их последовательный вызов.
+
+        Промежуточные копии DataFrame не создаются: группы вычисляются по кодам factorize для отобранных строк,
+        новые коды сигналов формируются только для нужных строк, названия устройств объединяются один раз
+        для каждого slave_id, а итоговый DataFrame собирается из столбцов один раз.
+
+        Параметры:
+        - signals: общий DataFrame со всеми сигналами.
+
+        Возвращает:
+        - DataFrame с обработанными сигналами.
+        """
+
+        # Фильтрация (filter_signals):
+        positions = np.flatnonzero(
+            (signals[settings.SIGNAL_TYPE_COLUMN] == settings.ONLY_SIGNALS_TYPE).to_numpy(dtype=bool) &
+            signals[settings.ADDRESS_COLUMN].notna().to_numpy()
+        )
+        addresses = signals[settings.ADDRESS_COLUMN].take(positions)
+        common_addresses = signals[settings.COMMON_ADDRESS_COLUMN].take(positions)
+        gateways = signals[settings.GATEWAY_COLUMN].take(positions).astype(object).to_numpy()
+        codes = signals[settings.CODE_COLUMN].take(positions).astype(object).to_numpy()
+
+        # Количество сигналов в каждом регистре (group_signals). Строки без slave_id не входят в группы:
+        address_codes, address_values = pd.factorize(addresses)
+        common_address_codes, common_address_values = pd.factorize(common_addresses)
+        register_codes = pd.factorize(address_codes * (len(common_address_values) + 1) + common_address_codes)[0]
+        group_counts = np.bincount(register_codes)[register_codes]
+        missing_common_address = common_address_codes < 0
+
+        # Коды формируются только для строк регистров с несколькими сигналами; при наличии строк без slave_id
+        # количество сигналов записывается как вещественное число, как в group_signals
+        grouped = np.flatnonzero((group_counts > 1) & ~missing_common_address)
+        count_format = "{:.1f}" if missing_common_address.any() else "{}"
+        address_strings = np.array([str(value) for value in address_values], dtype=object)[address_codes[grouped]]
+        codes = (pd.Series(codes, copy=False) + "_" + pd.Series(gateways, copy=False)).to_numpy(dtype=object)
+        counts = pd.Series([count_format.format(count) for count in group_counts[grouped].tolist()], dtype=object)
+        codes[grouped] = (
+            counts + "_signals_" + pd.Series(gateways[grouped], dtype=object) + "_" + pd.Series(address_strings)
+        ).to_numpy(dtype=object)
+
+        # Удаление дубликатов:
+        unique_rows = ~pd.Series(codes).duplicated().to_numpy()
+        positions = positions[unique_rows]
+        codes = codes[unique_rows]
+        common_address_codes = common_address_codes[unique_rows]
+
+        # Объединение названий устройств с одинаковым slave_id (concatenate_devices):
+        device_codes, device_values = pd.factorize(
+            signals[settings.SIGNALS_SHEET_DEVICE_COLUMN].take(positions),
+            use_na_sentinel=False
+        )
+        device_values = np.asarray(device_values, dtype=object)
+        pairs = pd.unique(common_address_codes * (len(device_values) + 1) + device_codes)
+        device_lists = [[] for _ in range(len(common_address_values))]
+        for common_address_code, device_code in zip(*np.divmod(pairs, len(device_values) + 1)):
+            if common_address_code >= 0:
+                device_lists[common_address_code].append(device_values[device_code])
+        device_names = np.array([', '.join(device_list) for device_list in device_lists] + [np.nan], dtype=object)
+
+        # Заполнение отсутствующих типов данных (fill_missing_data_types):
+        value_types = signals[settings.VALUE_TYPE_COLUMN].take(positions)
+        missing_count = value_types.isnull().sum()
+        if missing_count > 0:
+            logging.warning(f"В столбце {settings.VALUE_TYPE_COLUMN} отсутствуют значения в {missing_count} строчках")
+            if isinstance(value_types.dtype, pd.CategoricalDtype) and 'hfloat' not in value_types.cat.categories:
+                value_types = value_types.cat.add_categories('hfloat')
+            value_types = value_types.fillna('hfloat')
+            logging.info(f"{missing_count} сигналам установлен тип hfloat")
+        else:
+            logging.info(f"Отсутствующие значения в столбце {settings.VALUE_TYPE_COLUMN} не обнаружены.")
+
+        # Сборка итогового DataFrame:
+        index = signals.index.take(positions)
+        columns = {}
+        for column in signals.columns:
+            if column == settings.CODE_COLUMN:
+                columns[column] = pd.Series(codes, index=index, name=column)
+            elif column == settings.SIGNALS_SHEET_DEVICE_COLUMN:
+                columns[column] = pd.Series(
+                    pd.Categorical(device_names[common_address_codes]), index=index, name=column
+                )
+            elif column == settings.VALUE_TYPE_COLUMN:
+                columns[column] = value_types
+            else:
+                columns[column] = signals[column].take(positions)
+        return pd.DataFrame(columns, index=index)
+
+    @staticmethod
+    def divide_by_assets(signals: pd.DataFrame) -> Iterator[tuple[str, pd.DataFrame]]:
         """
         Разбивает сигналы по ассетам (если переменная DIVIDE_CONFIG_BY_ASSET или DIVIDE_DATA_BY_ASSET
-        в .env файле в состоянии True).
+        в .env файле в состоянии True). Возвращаются только те части, для которых будут созданы файлы.
+
+        Разбиение выполняется за один проход: строки группируются по ассетам в порядке их появления,
+        а DataFrame каждого ассета создается только при переходе генератора к этому ассету.
 
         Параметры:
         - signals: DataFrame, содержащий все сигналы.
 
         Возвращает:
-        - dict: словарь из ключей с названием ассетов и значений (с Dataframe сигналов этих ассетов),
-         ключ "all_assets" - и общий Dataframe сигналов если разделение не требуется.
+        - Iterator: генератор пар (название ассета, Dataframe сигналов этого ассета),
+         первой парой идет "all_assets" - общий Dataframe сигналов, если для него создаются файлы.
         """
 
-        signals_divided_by_assets = {'all_assets': signals}
+        if OutputPlanner.needs_all_assets():
+            yield 'all_assets', signals
 
-        if settings.DIVIDE_CONFIG_BY_ASSET or settings.DIVIDE_DATA_BY_ASSET:
-            assets = signals[settings.ASSET_COLUMN].unique()
-            for asset in assets:
-                signals_by_asset = signals[signals[settings.ASSET_COLUMN] == asset]
-                signals_divided_by_assets[asset] = signals_by_asset
-        return signals_divided_by_assets
+        if OutputPlanner.needs_asset_partitions():
+            asset_codes, assets = pd.factorize(signals[settings.ASSET_COLUMN], use_na_sentinel=False)
+            order = np.argsort(asset_codes, kind="stable")
+            bounds = np.concatenate(([0], np.cumsum(np.bincount(asset_codes, minlength=len(assets)))))
+            for asset, start, stop in zip(assets, bounds[:-1], bounds[1:]):
+                yield asset, signals.take(order[start:stop])
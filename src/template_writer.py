@@ -0,0 +1,164 @@
+import csv
+import math
+import zipfile
+from pathlib import Path
+from typing import Iterable
+from xml.sax.saxutils import escape
+
+# Минимальный набор частей xlsx-файла с одним листом
+_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '</Types>'
+)
+_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="Sheet1" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet1.xml"/>'
+    '<Relationship Id="rId2" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+    'Target="styles.xml"/>'
+    '</Relationships>'
+)
+_STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/></cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+_SHEET_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<sheetData><row r="1">'
+)
+_SHEET_TAIL = '</row></sheetData></worksheet>'
+
+# Количество ячеек, записываемых в архив за одну операцию
+_CHUNK_SIZE = 1024
+
+# Максимальное количество столбцов на листе excel
+_MAX_COLUMNS = 16384
+
+
+def _column_letter(index: int) -> str:
+    """Возвращает буквенное обозначение столбца excel по его номеру (начиная с 1)."""
+
+    letters = ""
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord("A") + remainder) + letters
+    return letters
+
+
+def _is_missing(value) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+class TemplateWriter:
+    """
+    Класс для записи шаблона данных - файла, содержащего только строку заголовка с кодами сигналов.
+
+    Заголовок имеет ту же структуру, что и при записи пустого DataFrame через DataFrame.to_excel:
+    первая ячейка (столбец индекса) пустая, далее - коды сигналов. Файл xlsx формируется напрямую,
+    без pandas и openpyxl, ячейки записываются в архив частями, поэтому потребление памяти
+    не зависит от количества сигналов.
+    """
+
+    FORMATS = ("xlsx", "csv", "parquet")
+
+    @staticmethod
+    def write(codes: Iterable, file_name: Path, template_format: str = "xlsx") -> None:
+        """
+        Записывает шаблон данных в файл.
+
+        Параметры:
+        - codes: коды сигналов (заголовки столбцов).
+        - file_name: путь к файлу.
+        - template_format: формат файла - "xlsx", "csv" или "parquet".
+        """
+
+        if template_format == "xlsx":
+            TemplateWriter.write_xlsx(codes, file_name)
+        elif template_format == "csv":
+            TemplateWriter.write_csv(codes, file_name)
+        elif template_format == "parquet":
+            TemplateWriter.write_parquet(codes, file_name)
+        else:
+            raise ValueError(f"Неизвестный формат шаблона данных '{template_format}', допустимы: {TemplateWriter.FORMATS}")
+
+    @staticmethod
+    def write_xlsx(codes: Iterable, file_name: Path) -> None:
+        """Записывает шаблон данных в xlsx-файл."""
+
+        with zipfile.ZipFile(file_name, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr("[Content_Types].xml", _CONTENT_TYPES)
+            archive.writestr("_rels/.rels", _ROOT_RELS)
+            archive.writestr("xl/workbook.xml", _WORKBOOK)
+            archive.writestr("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS)
+            archive.writestr("xl/styles.xml", _STYLES)
+            with archive.open("xl/worksheets/sheet1.xml", "w") as sheet:
+                sheet.write(_SHEET_HEAD.encode("utf-8"))
+                cells = []
+                # Первый столбец (A) соответствует индексу и остается пустым
+                for column, code in enumerate(codes, start=2):
+                    if column > _MAX_COLUMNS:
+                        raise ValueError(
+                            f"Количество сигналов превышает максимальное количество столбцов excel ({_MAX_COLUMNS - 1}), "
+                            f"используйте формат шаблона данных csv или parquet"
+                        )
+                    if _is_missing(code):
+                        continue
+                    cells.append(
+                        f'<c r="{_column_letter(column)}1" t="inlineStr"><is><t>{escape(str(code))}</t></is></c>'
+                    )
+                    if len(cells) >= _CHUNK_SIZE:
+                        sheet.write("".join(cells).encode("utf-8"))
+                        cells = []
+                sheet.write("".join(cells).encode("utf-8"))
+                sheet.write(_SHEET_TAIL.encode("utf-8"))
+
+    @staticmethod
+    def write_csv(codes: Iterable, file_name: Path) -> None:
+        """Записывает шаблон данных в csv-файл."""
+
+        with open(file_name, "w", encoding="utf-8", newline="") as csv_file:
+            csv.writer(csv_file).writerow(["", *("" if _is_missing(code) else code for code in codes)])
+
+    @staticmethod
+    def write_parquet(codes: Iterable, file_name: Path) -> None:
+        """Записывает шаблон данных в parquet-файл (требуется pyarrow)."""
+
+        import pandas as pd
+
+        pd.DataFrame(columns=[str(code) for code in codes]).to_parquet(file_name)
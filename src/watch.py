@@ -0,0 +1,140 @@
+import logging
+import time
+from pathlib import Path
+from pydantic import ValidationError
+from main import main
+from settings import Settings, settings
+
+
+def get_env_file() -> Path:
+    """Возвращает путь к .env файлу, из которого читаются настройки."""
+
+    return Path(Settings.model_config["env_file"])
+
+
+def get_snapshot() -> dict[Path, tuple[int, int]]:
+    """
+    Возвращает время изменения и размер файлов в папке INPUT_FILES_DIR и .env файла
+    (временные файлы excel не учитываются).
+    """
+
+    paths = [get_env_file()]
+    if settings.INPUT_FILES_DIR.is_dir():
+        paths.extend(
+            path for path in settings.INPUT_FILES_DIR.iterdir()
+            if path.is_file() and not path.name.startswith(("~$", "."))
+        )
+    snapshot = {}
+    for path in paths:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+def get_changed_files(previous: dict, current: dict) -> set[Path]:
+    """Возвращает файлы, которые были созданы, изменены или удалены между двумя снимками."""
+
+    return {path for path in previous.keys() | current.keys() if previous.get(path) != current.get(path)}
+
+
+def wait_for_changes(snapshot: dict) -> tuple[dict, set[Path]]:
+    """
+    Ожидает изменения файлов и возвращает новый снимок и измененные файлы. Изменения считаются завершенными,
+    когда в течение WATCH_DEBOUNCE секунд файлы больше не меняются (excel сохраняет файл в несколько этапов).
+    """
+
+    while True:
+        time.sleep(settings.WATCH_INTERVAL)
+        current = get_snapshot()
+        if current == snapshot:
+            continue
+        # Ожидание завершения сохранения:
+        while True:
+            time.sleep(settings.WATCH_DEBOUNCE)
+            latest = get_snapshot()
+            if latest == current:
+                break
+            current = latest
+        return current, get_changed_files(snapshot, current)
+
+
+def reload_settings() -> bool:
+    """
+    Перечитывает настройки из переменных окружения и .env файла.
+
+    Возвращает:
+    - bool: True, если настройки изменились.
+    """
+
+    try:
+        values = Settings().model_dump()
+    except ValidationError:
+        logging.exception("Ошибка в настройках, используются предыдущие значения")
+        return False
+    if values == settings.model_dump():
+        return False
+    settings.override(**values)
+    logging.getLogger().setLevel(settings.LOGGING_LEVEL)
+    logging.info("Настройки перечитаны")
+    return True
+
+
+def regenerate(saved_at: float | None) -> None:
+    """
+    Создает файлы для списка сигналов и выводит время от сохранения файла до готовности конфига.
+
+    Параметры:
+    - saved_at: время сохранения изменившегося файла (None при первом запуске).
+    """
+
+    start = time.perf_counter()
+    try:
+        main()
+    except Exception:
+        logging.exception("Ошибка при создании файлов, ожидание следующего изменения")
+        return
+    elapsed = time.perf_counter() - start
+    if saved_at is None:
+        logging.info(f"Файлы созданы за {elapsed:.2f} с")
+    else:
+        logging.info(
+            f"Файлы обновлены через {time.time() - saved_at:.2f} с после сохранения (обработка {elapsed:.2f} с)"
+        )
+
+
+def watch() -> None:
+    """
+    Отслеживает изменения списка сигналов в папке INPUT_FILES_DIR и .env файла и пересоздает файлы
+    в том же процессе (без повторного импорта библиотек и чтения настроек при каждом запуске).
+    Пересоздаются только файлы изменившихся ассетов (см. INCREMENTAL_OUTPUT).
+    """
+
+    env_file = get_env_file()
+    snapshot = get_snapshot()
+    regenerate(saved_at=None)
+    logging.info(f"Ожидание изменений {settings.LIST_OF_SIGNALS_FILE} и {env_file} (Ctrl+C для выхода)")
+    while True:
+        snapshot, changed_files = wait_for_changes(snapshot)
+        settings_changed = env_file in changed_files and reload_settings()
+        if not settings_changed and settings.LIST_OF_SIGNALS_FILE not in changed_files:
+            logging.debug(f"Изменения не затрагивают список сигналов: {', '.join(map(str, changed_files))}")
+            continue
+        if settings_changed:
+            # Папка с входными файлами могла измениться:
+            snapshot = get_snapshot()
+        saved_at = max(
+            (snapshot[path][0] / 1e9 for path in changed_files if path in snapshot),
+            default=None
+        )
+        logging.info(f"Обнаружены изменения: {', '.join(path.name for path in sorted(changed_files))}")
+        regenerate(saved_at)
+
+
+if __name__ == "__main__":
+    try:
+        watch()
+    except KeyboardInterrupt:
+        logging.info("Отслеживание изменений остановлено")
@@ -0,0 +1,107 @@
+import importlib.util
+from pathlib import Path
+from typing import Iterator
+from settings import settings
+
+# Строки, которые pandas при чтении excel-файла считает отсутствующими значениями (na_values по умолчанию)
+NA_VALUES = frozenset({
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null"
+})
+
+
+class WorkbookReader:
+    """
+    Класс для чтения столбцов страниц Excel-файла без pandas (для создания JSON-конфигов без шаблонов данных).
+
+    Значения приводятся к строкам так же, как при чтении через pandas.read_excel с dtype=str:
+    целые числа, записанные как вещественные, - без дробной части, пустые ячейки и строки из NA_VALUES - None,
+    полностью пустые строки таблицы пропускаются.
+    """
+
+    def __init__(self, signals_file: Path):
+        self.signals_file = signals_file
+
+    @staticmethod
+    def get_engine() -> str:
+        """
+        Возвращает движок для чтения Excel-файла.
+
+        Если движок не задан в настройках (EXCEL_ENGINE), используется calamine при наличии
+        установленного пакета python-calamine, иначе openpyxl (в режиме read-only).
+        """
+
+        if settings.EXCEL_ENGINE:
+            return settings.EXCEL_ENGINE
+        if importlib.util.find_spec("python_calamine") is not None:
+            return "calamine"
+        return "openpyxl"
+
+    def read(self, columns_by_sheets: dict[str, list[str]]) -> dict[str, list[tuple]]:
+        """
+        Читает строки нужных столбцов со страниц Excel-файла за одно открытие файла.
+
+        Параметры:
+        - columns_by_sheets: названия столбцов для каждой страницы.
+
+        Возвращает:
+        - dict: для каждой страницы - список строк, значения в строках в порядке запрошенных столбцов.
+
+        Исключения:
+        - ValueError: если на странице нет запрошенного столбца.
+        """
+
+        engine = self.get_engine()
+        if engine == "calamine":
+            from python_calamine import CalamineWorkbook
+
+            workbook = CalamineWorkbook.from_path(str(self.signals_file))
+            try:
+                return {
+                    sheet: self._select(iter(workbook.get_sheet_by_name(sheet).to_python()), columns)
+                    for sheet, columns in columns_by_sheets.items()
+                }
+            finally:
+                workbook.close()
+        if engine == "openpyxl":
+            from openpyxl import load_workbook
+
+            workbook = load_workbook(self.signals_file, read_only=True, data_only=True, keep_links=False)
+            try:
+                return {
+                    sheet: self._select(workbook[sheet].iter_rows(values_only=True), columns)
+                    for sheet, columns in columns_by_sheets.items()
+                }
+            finally:
+                workbook.close()
+        raise ValueError(f"Движок {engine} не поддерживается при создании конфигов без pandas")
+
+    @staticmethod
+    def _select(rows: Iterator[tuple], columns: list[str]) -> list[tuple]:
+        """Отбирает из строк страницы значения нужных столбцов (первая строка - заголовок)."""
+
+        header = [WorkbookReader.to_str(value) for value in next(rows, ())]
+        missing_columns = [column for column in columns if column not in header]
+        if missing_columns:
+            raise ValueError(f"На странице нет столбцов: {', '.join(missing_columns)}")
+        positions = [header.index(column) for column in columns]
+
+        selected = []
+        for row in rows:
+            values = [WorkbookReader.to_str(value) for value in row]
+            if all(value is None for value in values):
+                continue
+            values.extend([None] * (len(header) - len(values)))
+            selected.append(tuple(values[position] for position in positions))
+        return selected
+
+    @staticmethod
+    def to_str(value) -> str | None:
+        """Приводит значение ячейки к строке (None - для пустых ячеек и отсутствующих значений)."""
+
+        if value is None:
+            return None
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)
+        value = str(value)
+        return None if value in NA_VALUES else value
@@ -0,0 +1,61 @@
+import logging
+from typing import Any, Callable
+from settings import settings
+
+
+class BufferHandler(logging.Handler):
+    """Обработчик логов, накапливающий записи в рабочем процессе для передачи в основной процесс."""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Приведение записи к виду, пригодному для передачи между процессами
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        self.records.append(record)
+
+    def pop_records(self) -> list[logging.LogRecord]:
+        """Возвращает накопленные записи и очищает буфер."""
+
+        records, self.records = self.records, []
+        return records
+
+
+buffer_handler = BufferHandler()
+
+
+def install_buffer_handler(level: str) -> None:
+    """Заменяет обработчики корневого логгера рабочего процесса на буферизующий обработчик."""
+
+    root_logger = logging.getLogger()
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(buffer_handler)
+    root_logger.setLevel(level)
+
+
+def init_worker(settings_values: dict) -> None:
+    """Инициализирует рабочий процесс пула: настройки основного процесса и буферизация логов."""
+
+    settings.override(**settings_values)
+    install_buffer_handler(settings.LOGGING_LEVEL)
+
+
+def call_buffered(func: Callable, *args) -> tuple[list[logging.LogRecord], Any]:
+    """Выполняет функцию в рабочем процессе и возвращает накопленные за время ее работы логи и результат."""
+
+    buffer_handler.pop_records()
+    result = func(*args)
+    return buffer_handler.pop_records(), result
+
+
+def replay_records(records: list[logging.LogRecord]) -> None:
+    """Выводит записи, полученные из рабочего процесса, через логгеры основного процесса."""
+
+    for record in records:
+        logging.getLogger(record.name).handle(record)
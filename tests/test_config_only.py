@@ -0,0 +1,96 @@
+"""
+Проверка совпадения JSON-конфигов, созданных без pandas (ConfigOnlyPipeline, PANDAS_FREE_CONFIGS=True),
+с конфигами, созданными через pandas, на синтетических списках сигналов (benchmarks/synthetic.py).
+
+Запуск из корня репозитория:
+    python -m unittest discover tests
+"""
+import logging
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR / "src"))
+sys.path.insert(0, str(ROOT_DIR / "benchmarks"))
+os.environ.setdefault("LIST_OF_SIGNALS_NAME", "test.xlsx")
+
+from main import process_signals_file
+from settings import settings
+from synthetic import generate_workbook
+
+# Доли строк с отсутствующими и нестандартными значениями в списках сигналов
+WORKBOOKS = {
+    "без пропусков": {"missing_addresses": 0.0, "missing_value_types": 0.0},
+    "с пропусками": {
+        "missing_gateways": 0.1,
+        "missing_codes": 0.05,
+        "missing_assets": 0.05,
+        "non_canonical_addresses": 0.02,
+        "unknown_devices": 0.02,
+        "duplicate_devices": 0.05
+    }
+}
+
+# Наборы настроек, влияющих на содержимое и количество конфигов
+SETTINGS_CASES = {
+    "по ассетам": {},
+    "все ассеты": {"DIVIDE_CONFIG_BY_ASSET": False},
+    "общий шаблон данных": {"DIVIDE_DATA_BY_ASSET": False},
+    "блоки регистров": {"HOLDINGS_LAYOUT": "blocks"},
+    "3 сервера": {"SERVERS": 3},
+}
+
+
+def create_configs(output_dir: Path, pandas_free: bool) -> dict[str, bytes]:
+    """Создает конфиги в папке и возвращает их содержимое по именам файлов."""
+
+    with settings.overridden(OUTPUT_FILES_DIR=output_dir, PANDAS_FREE_CONFIGS=pandas_free):
+        process_signals_file()
+    return {path.name: path.read_bytes() for path in sorted(output_dir.glob("*.json"))}
+
+
+class ConfigOnlyPipelineTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+        cls.input_dir = Path(cls.tmp_dir.name)
+        for index, params in enumerate(WORKBOOKS.values()):
+            generate_workbook(cls.input_dir / f"signals_{index}.xlsx", signals=2_000, devices=40, assets=4, **params)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp_dir.cleanup()
+
+    def setUp(self):
+        # Предупреждения о пропущенных типах данных и повторяющихся регистрах ожидаемы для синтетических данных
+        logging.disable(logging.CRITICAL)
+        self.addCleanup(logging.disable, logging.NOTSET)
+
+    def test_configs_match_pandas_path(self):
+        for index, workbook_name in enumerate(WORKBOOKS):
+            for case_name, case in SETTINGS_CASES.items():
+                with self.subTest(workbook=workbook_name, settings=case_name), settings.overridden(
+                    INPUT_FILES_DIR=self.input_dir,
+                    LIST_OF_SIGNALS_NAME=f"signals_{index}.xlsx",
+                    CREATE_DATA_TEMPLATES=False,
+                    CACHE_ENABLED=False,
+                    INCREMENTAL_OUTPUT=False,
+                    WORKERS=1,
+                    **case
+                ):
+                    output_dir = self.input_dir / f"output_{index}_{case_name}"
+                    pandas_configs = create_configs(output_dir / "pandas", pandas_free=False)
+                    pandas_free_configs = create_configs(output_dir / "pandas_free", pandas_free=True)
+
+                    self.assertTrue(pandas_configs)
+                    self.assertEqual(sorted(pandas_configs), sorted(pandas_free_configs))
+                    for name, content in pandas_configs.items():
+                        self.assertEqual(content, pandas_free_configs[name], f"Различается содержимое {name}")
+
+
+if __name__ == "__main__":
+    unittest.main()